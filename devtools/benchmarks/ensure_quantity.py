@@ -0,0 +1,40 @@
+"""
+Time ``ensure_quantity`` for each supported input type and target.
+
+Run with ``python devtools/benchmarks/ensure_quantity.py``. Requires OpenMM.
+"""
+
+import timeit
+
+import numpy
+from openmm import unit as openmm_unit
+
+from openff.units import Quantity
+from openff.units.openmm import ensure_quantity
+
+INPUTS = {
+    "OpenFF Quantity": Quantity(1.0, "angstrom"),
+    "OpenMM Quantity": openmm_unit.Quantity(1.0, openmm_unit.angstrom),
+    "numpy.ndarray": numpy.arange(10.0),
+    "float": 1.0,
+    "int": 1,
+}
+
+
+def main(number: int = 10_000, repeats: int = 5):
+    print(f"best of {repeats}, per call")
+
+    for type_to_ensure in ["openff", "openmm"]:
+        for name, value in INPUTS.items():
+            best = min(
+                timeit.repeat(
+                    lambda: ensure_quantity(value, type_to_ensure),
+                    number=number,
+                    repeat=repeats,
+                )
+            )
+            print(f"{name:<16} -> {type_to_ensure:<6} {1e6 * best / number:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
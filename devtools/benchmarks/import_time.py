@@ -0,0 +1,36 @@
+"""
+Measure the wall time of importing parts of OpenFF Units in fresh interpreters.
+
+Run with ``python devtools/benchmarks/import_time.py``. Set ``OPENFF_UNITS_CACHE_FOLDER`` to
+compare against a registry loaded from the on-disk cache.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "python only": "pass",
+    "openff.units": "import openff.units",
+    "elements.SYMBOLS": "from openff.units.elements import SYMBOLS; SYMBOLS[6]",
+    "elements.MASSES": "from openff.units.elements import MASSES; MASSES[6]",
+    "openff.units.unit": "from openff.units import unit; unit.angstrom",
+}
+
+
+def time_import(code: str, repeats: int = 10) -> float:
+    """Return the median wall time, in seconds, of running ``code`` in a new interpreter."""
+    timings = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    for name, code in SCENARIOS.items():
+        print(f"{name:<20} {1000 * time_import(code):8.1f} ms")
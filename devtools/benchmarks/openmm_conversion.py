@@ -0,0 +1,50 @@
+"""
+Compare converting many quantities to and from OpenMM one at a time and in bulk.
+
+Run with ``python devtools/benchmarks/openmm_conversion.py``. Requires OpenMM.
+"""
+
+import random
+import timeit
+
+from openff.units import Quantity
+from openff.units.openmm import from_openmm, from_openmm_many, to_openmm, to_openmm_many
+
+UNITS = [
+    "angstrom",
+    "nanometer",
+    "degree",
+    "kilocalorie / mole",
+    "kilocalorie / mole / angstrom ** 2",
+    "kilocalorie / mole / radian ** 2",
+    "kilojoule / mole",
+    "elementary_charge",
+    "dalton",
+    "kelvin",
+    "picosecond",
+    "atmosphere",
+]
+
+
+def main(n_quantities: int = 100_000, repeats: int = 5):
+    openff_quantities = [
+        Quantity(random.random(), random.choice(UNITS)) for _ in range(n_quantities)
+    ]
+    openmm_quantities = to_openmm_many(openff_quantities)
+
+    benchmarks = {
+        "to_openmm loop": lambda: [to_openmm(q) for q in openff_quantities],
+        "to_openmm_many": lambda: to_openmm_many(openff_quantities),
+        "from_openmm loop": lambda: [from_openmm(q) for q in openmm_quantities],
+        "from_openmm_many": lambda: from_openmm_many(openmm_quantities),
+    }
+
+    print(f"{n_quantities} quantities in {len(UNITS)} units, best of {repeats}")
+
+    for name, function in benchmarks.items():
+        best = min(timeit.repeat(function, number=1, repeat=repeats))
+        print(f"{name:<20} {1000 * best:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
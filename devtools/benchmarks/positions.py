@@ -0,0 +1,35 @@
+"""
+Compare converting OpenMM positions, as a list of ``Vec3``, with ``from_openmm`` and
+``positions_from_openmm``.
+
+Run with ``python devtools/benchmarks/positions.py``. Requires OpenMM.
+"""
+
+import timeit
+
+import numpy
+from openmm import Vec3, unit
+
+from openff.units.openmm import positions_from_openmm, positions_to_openmm
+
+
+def main(n_atoms: int = 1_000_000, repeats: int = 3):
+    vectors = [
+        Vec3(*row) for row in numpy.random.default_rng().random((n_atoms, 3))
+    ] * unit.nanometer
+
+    benchmarks = {
+        "numpy.asarray (before)": lambda: numpy.asarray(vectors._value),
+        "positions_from_openmm": lambda: positions_from_openmm(vectors),
+        "from + positions_to_openmm": lambda: positions_to_openmm(positions_from_openmm(vectors)),
+    }
+
+    print(f"{n_atoms} atoms, best of {repeats}")
+
+    for name, function in benchmarks.items():
+        best = min(timeit.repeat(function, number=1, repeat=repeats))
+        print(f"{name:<25} {1000 * best:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
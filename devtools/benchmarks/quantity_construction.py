@@ -0,0 +1,32 @@
+"""
+Compare ways of constructing a scalar ``Quantity``.
+
+Run with ``python devtools/benchmarks/quantity_construction.py``.
+"""
+
+import timeit
+
+from openff.units import Quantity, Unit
+
+UNIT_STRING = "kilocalorie / mole / angstrom ** 2"
+
+
+def main(number: int = 100_000, repeats: int = 5):
+    units = Unit(UNIT_STRING)
+
+    benchmarks = {
+        "Quantity(value, str)": lambda: Quantity(1.5, UNIT_STRING),
+        "Quantity(value, Unit)": lambda: Quantity(1.5, units),
+        "Quantity.from_magnitude(value, str)": lambda: Quantity.from_magnitude(1.5, UNIT_STRING),
+        "Quantity.from_magnitude(value, Unit)": lambda: Quantity.from_magnitude(1.5, units),
+    }
+
+    print(f"best of {repeats}, per call")
+
+    for name, function in benchmarks.items():
+        best = min(timeit.repeat(function, number=number, repeat=repeats))
+        print(f"{name:<40} {1e6 * best / number:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
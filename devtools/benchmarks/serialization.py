@@ -0,0 +1,45 @@
+"""
+Compare round-tripping many quantities through JSON as strings and as dictionaries.
+
+Run with ``python devtools/benchmarks/serialization.py``.
+"""
+
+import json
+import time
+
+from openff.units import Quantity
+from openff.units.serialization import decode_tree, encode_tree
+
+UNITS = ["kilocalorie / mole", "angstrom", "kilocalorie / mole / angstrom ** 2", "degree"]
+
+
+def main(n_quantities: int = 100_000):
+    quantities = [Quantity(float(i), UNITS[i % len(UNITS)]) for i in range(n_quantities)]
+
+    start = time.perf_counter()
+    text = json.dumps([str(quantity) for quantity in quantities])
+    dumped = time.perf_counter()
+    [Quantity(string) for string in json.loads(text)]
+    loaded = time.perf_counter()
+
+    print(f"{n_quantities} quantities")
+    print(
+        f"{'str / Quantity(str)':<40} dump {dumped - start:6.3f} s, load {loaded - dumped:6.3f} s"
+    )
+
+    start = time.perf_counter()
+    text = json.dumps(encode_tree(quantities))
+    dumped = time.perf_counter()
+    parsed = json.loads(text)
+    parsed_time = time.perf_counter()
+    decode_tree(parsed)
+    loaded = time.perf_counter()
+
+    print(
+        f"{'encode_tree / decode_tree':<40} dump {dumped - start:6.3f} s, load "
+        f"{loaded - dumped:6.3f} s (of which json.loads {parsed_time - dumped:6.3f} s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
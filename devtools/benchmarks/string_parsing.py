@@ -0,0 +1,108 @@
+"""
+Compare converting the strings of force field-like data by parsing each string in full, as done
+downstream, and with ``openff.units.parsing.convert_all_strings_to_quantity``. Then compare
+parsing a column of strings into one array by stacking scalar quantities, and with
+``Quantity.from_strings``.
+
+Run with ``python devtools/benchmarks/string_parsing.py``.
+"""
+
+import copy
+import time
+from tokenize import TokenError
+
+import numpy
+from pint import UndefinedUnitError
+
+from openff.units import Quantity, unit
+from openff.units.parsing import convert_all_strings_to_quantity
+
+
+def _string_to_quantity(string):
+    try:
+        quantity = Quantity(string)
+    except (TokenError, UndefinedUnitError):
+        return string
+
+    if quantity.units == unit.dimensionless and isinstance(quantity.m, int | float):
+        return quantity.m
+
+    return quantity
+
+
+def _convert_in_full(data):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            data[key] = _convert_in_full(value)
+    elif isinstance(data, list):
+        for index, item in enumerate(data):
+            data[index] = _convert_in_full(item)
+    elif isinstance(data, str):
+        return _string_to_quantity(data)
+
+    return data
+
+
+def _force_field(n_parameters: int) -> dict:
+    return {
+        "Bonds": {
+            "version": "0.4",
+            "potential": "harmonic",
+            "Bond": [
+                {
+                    "smirks": f"[#6X4:1]-[#{index % 20 + 1}:2]",
+                    "id": f"b{index}",
+                    "length": f"{1.0 + index * 1e-4} * angstrom",
+                    "k": f"{500.0 + index} * angstrom**-2 * mole**-1 * kilocalorie",
+                }
+                for index in range(n_parameters)
+            ],
+        },
+        "vdW": {
+            "potential": "Lennard-Jones-12-6",
+            "cutoff": "9.0 * angstrom",
+            "Atom": [
+                {
+                    "smirks": f"[#{index % 20 + 1}:1]",
+                    "epsilon": f"{0.1 + index * 1e-4} * mole**-1 * kilocalorie",
+                    "rmin_half": f"{1.5 + index * 1e-4} * angstrom",
+                }
+                for index in range(n_parameters)
+            ],
+        },
+    }
+
+
+def main(n_parameters: int = 5_000):
+    data = _force_field(n_parameters)
+
+    print(f"{n_parameters * 2} parameters")
+
+    for label, function in [
+        ("Quantity(str) for every string", _convert_in_full),
+        ("convert_all_strings_to_quantity", convert_all_strings_to_quantity),
+    ]:
+        copied = copy.deepcopy(data)
+
+        start = time.perf_counter()
+        function(copied)
+        elapsed = time.perf_counter() - start
+
+        print(f"{label:<40} {elapsed:6.3f} s")
+
+    column = [f"{1.0 + index * 1e-4} * angstrom" for index in range(n_parameters * 10)]
+    column[::10] = [f"{0.1 + index * 1e-5} * nanometer" for index in range(n_parameters)]
+
+    start = time.perf_counter()
+    Quantity(numpy.array([Quantity(string).m_as("angstrom") for string in column]), "angstrom")
+    stacked = time.perf_counter()
+    Quantity.from_strings(column)
+    parsed = time.perf_counter()
+
+    print(f"{len(column)} strings in a column, with 10% in other units")
+    print(f"{'stack Quantity(str)':<40} {stacked - start:6.3f} s")
+    print(f"{'Quantity.from_strings':<40} {parsed - stacked:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Measure the throughput of parsing and converting quantities from a growing number of threads.
+
+Throughput only scales with the number of threads on free-threaded builds of Python, like
+``python3.14t``; with the GIL, it should stay roughly constant.
+
+Run with ``python devtools/benchmarks/threads.py``.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from openff.units import DEFAULT_UNIT_REGISTRY, Quantity
+
+UNITS = ["angstrom", "kilocalorie / mole", "picosecond", "elementary_charge"]
+TARGETS = ["nanometer", "kilojoule / mole", "femtosecond", "coulomb"]
+
+
+def _work(n_quantities: int) -> float:
+    total = 0.0
+
+    for index in range(n_quantities):
+        position = index % len(UNITS)
+        quantity = Quantity(f"{index} * {UNITS[position]}")
+        total += quantity.m_as(TARGETS[position])
+
+    strings = [f"{index * 0.1} * angstrom" for index in range(n_quantities)]
+    total += Quantity.from_strings(strings, units="nanometer").m.sum()
+
+    return total
+
+
+def main(n_tasks: int = 32, n_quantities: int = 1_000):
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+    print(f"{os.cpu_count()} CPUs, {n_tasks} tasks of {n_quantities} quantities")
+
+    DEFAULT_UNIT_REGISTRY.freeze()
+
+    # warm up caches, so that every thread count measures the same work
+    _work(n_quantities)
+
+    baseline = None
+
+    for n_threads in [1, 2, 4, 8]:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            start = time.perf_counter()
+            list(executor.map(_work, [n_quantities] * n_tasks))
+            elapsed = time.perf_counter() - start
+
+        throughput = n_tasks * n_quantities / elapsed
+        baseline = baseline or throughput
+
+        print(
+            f"{n_threads} threads: {throughput:10.0f} quantities / s "
+            f"({throughput / baseline:4.2f}x one thread)"
+        )
+
+
+if __name__ == "__main__":
+    main()
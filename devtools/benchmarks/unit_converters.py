@@ -0,0 +1,35 @@
+"""
+Compare converting trajectory frames with ``Quantity.m_as`` and with a precomputed converter.
+
+Run with ``python devtools/benchmarks/unit_converters.py``.
+"""
+
+import timeit
+
+import numpy
+
+from openff.units import Quantity, make_converter
+
+
+def main(n_atoms: int = 10_000, number: int = 1_000, repeats: int = 5):
+    frame = numpy.random.default_rng(0).uniform(0.0, 50.0, size=(n_atoms, 3))
+    quantity = Quantity(frame, "angstrom")
+    out = numpy.empty_like(frame)
+    to_nanometer = make_converter("angstrom", "nanometer")
+
+    benchmarks = {
+        "Quantity.m_as": lambda: quantity.m_as("nanometer"),
+        "make_converter(...)(frame)": lambda: make_converter("angstrom", "nanometer")(frame),
+        "converter(frame)": lambda: to_nanometer(frame),
+        "converter(frame, out=out)": lambda: to_nanometer(frame, out=out),
+    }
+
+    print(f"{n_atoms} atoms, best of {repeats}, per call")
+
+    for name, function in benchmarks.items():
+        best = min(timeit.repeat(function, number=number, repeat=repeats))
+        print(f"{name:<40} {1e6 * best / number:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,9 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Type checkers can't see lazy-imported objects
+    from openff.units.converters import make_converter
     from openff.units.openmm import ensure_quantity
+    from openff.units.shared_memory import share
     from openff.units.units import (  # type: ignore[attr-defined]
         DEFAULT_UNIT_REGISTRY,
         Measurement,
@@ -31,11 +33,15 @@ __all__ = [
     "Quantity",
     "Unit",
     "ensure_quantity",
+    "make_converter",
+    "share",
     "unit",
 ]
 
 _objects: dict[str, str] = {
     "ensure_quantity": "openff.units.openmm",
+    "make_converter": "openff.units.converters",
+    "share": "openff.units.shared_memory",
     "Measurement": "openff.units.units",
     "Unit": "openff.units.units",
     "UnitRegistry": "openff.units.units",
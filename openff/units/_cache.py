@@ -0,0 +1,96 @@
+"""
+A small least-recently-used cache which keeps statistics for sizing it.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, similar to those reported by ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    A bounded mapping which evicts its least-recently-used entries. A size of 0 disables it.
+
+    Every operation holds a lock, so the cache can be shared between threads, including on
+    free-threaded builds of Python.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._lock = threading.Lock()
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError(f"Cache size must be non-negative, got {maxsize}.")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the value stored for ``key`` and mark it as recently used, or ``None``."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Store ``value`` for ``key``, evicting the least-recently-used entries if full."""
+        with self._lock:
+            if self._maxsize == 0:
+                return
+
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def clear(self):
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self._maxsize,
+                len(self._data),
+            )
+
+    def _evict(self):
+        """Evict entries until the cache fits its size. Must be called with the lock held."""
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
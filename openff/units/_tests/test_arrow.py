@@ -0,0 +1,154 @@
+import numpy
+import pytest
+from openff.utilities.testing import skip_if_missing
+
+from openff.units import Quantity, unit
+
+
+@pytest.fixture
+def columns():
+    rng = numpy.random.default_rng(0)
+
+    return {
+        "id": numpy.arange(10),
+        "energy": Quantity(rng.random(10), "kilocalorie / mole"),
+        "position": Quantity(rng.random((10, 3)), "nanometer"),
+        "temperature": Quantity(rng.random(10), "degree_Celsius"),
+    }
+
+
+@skip_if_missing("pyarrow")
+class TestArrow:
+    def test_schema_metadata(self, columns):
+        from openff.units.arrow import to_arrow
+
+        schema = to_arrow(columns).schema
+
+        assert schema.field("id").metadata is None
+        assert schema.field("energy").metadata == {b"unit": b"kilocalorie / mole"}
+        assert schema.field("position").metadata == {b"unit": b"nanometer"}
+        assert schema.field("temperature").metadata == {b"unit": b"degree_Celsius"}
+
+    def test_units_are_canonical(self):
+        from openff.units.arrow import to_arrow
+
+        table = to_arrow({"k": Quantity(numpy.ones(2), "angstrom ** -2 * mole ** -1 * kcal")})
+
+        assert table.schema.field("k").metadata == {b"unit": b"kilocalorie / angstrom ** 2 / mole"}
+
+    def test_round_trip(self, columns):
+        from openff.units.arrow import from_arrow, to_arrow
+
+        loaded = from_arrow(to_arrow(columns))
+
+        assert isinstance(loaded["id"], numpy.ndarray)
+        numpy.testing.assert_array_equal(loaded["id"], columns["id"])
+
+        for name in ["energy", "position", "temperature"]:
+            assert type(loaded[name]) is Quantity
+            assert loaded[name]._units == columns[name]._units
+            numpy.testing.assert_array_equal(loaded[name].m, columns[name].m)
+
+    def test_record_batches(self, columns):
+        from openff.units.arrow import from_arrow, to_arrow
+
+        (batch,) = to_arrow(columns).to_batches()
+
+        numpy.testing.assert_array_equal(from_arrow(batch)["position"].m, columns["position"].m)
+
+    def test_convert_units(self, columns):
+        from openff.units.arrow import from_arrow, to_arrow
+
+        loaded = from_arrow(
+            to_arrow(columns),
+            units={"energy": "kilojoule / mole", "temperature": unit.kelvin},
+        )
+
+        assert loaded["energy"].units == unit.kilojoule / unit.mole
+        numpy.testing.assert_allclose(
+            loaded["energy"].m,
+            columns["energy"].m_as("kilojoule / mole"),
+        )
+        numpy.testing.assert_allclose(
+            loaded["temperature"].m,
+            columns["temperature"].m_as("kelvin"),
+        )
+
+    def test_convert_incompatible_units(self, columns):
+        from pint.errors import DimensionalityError
+
+        from openff.units.arrow import from_arrow, to_arrow
+
+        with pytest.raises(DimensionalityError):
+            from_arrow(to_arrow(columns), units={"energy": "nanometer"})
+
+    @pytest.mark.parametrize(
+        ("units", "match"),
+        [({"id": "nanometer"}, "no units"), ({"mass": "dalton"}, "not found")],
+    )
+    def test_convert_bad_columns(self, columns, units, match):
+        from openff.units.arrow import from_arrow, to_arrow
+
+        with pytest.raises(ValueError, match=match):
+            from_arrow(to_arrow(columns), units=units)
+
+    def test_invalid_units(self):
+        import pyarrow
+
+        from openff.units.arrow import from_arrow
+
+        field = pyarrow.field("energy", pyarrow.float64(), metadata={b"unit": b"not_a_unit"})
+        table = pyarrow.Table.from_arrays([pyarrow.array([1.0])], schema=pyarrow.schema([field]))
+
+        with pytest.raises(ValueError, match="invalid units"):
+            from_arrow(table)
+
+    def test_three_dimensional(self):
+        from openff.units.arrow import to_arrow
+
+        with pytest.raises(ValueError, match="one- or two-dimensional"):
+            to_arrow({"frames": Quantity(numpy.zeros((2, 2, 3)), "nanometer")})
+
+
+@skip_if_missing("pyarrow")
+class TestParquet:
+    def test_round_trip(self, tmp_path, columns):
+        from openff.units.arrow import iter_parquet, write_parquet
+
+        write_parquet(tmp_path / "data.parquet", columns)
+        (batch,) = iter_parquet(tmp_path / "data.parquet")
+
+        numpy.testing.assert_array_equal(batch["id"], columns["id"])
+        numpy.testing.assert_array_equal(batch["position"].m, columns["position"].m)
+        assert batch["position"].units == unit.nanometer
+
+    def test_batches(self, tmp_path, columns):
+        from openff.units.arrow import iter_parquet, write_parquet
+
+        write_parquet(tmp_path / "data.parquet", columns, row_group_size=4)
+        batches = list(
+            iter_parquet(
+                tmp_path / "data.parquet",
+                columns=["energy", "position"],
+                units={"energy": "kilojoule / mole", "position": "angstrom"},
+                batch_size=3,
+            ),
+        )
+
+        assert all(batch.keys() == {"energy", "position"} for batch in batches)
+        assert all(len(batch["energy"]) <= 3 for batch in batches)
+
+        energy = numpy.concatenate([batch["energy"].m for batch in batches])
+        position = numpy.concatenate([batch["position"].m for batch in batches])
+
+        assert batches[0]["position"].units == unit.angstrom
+        numpy.testing.assert_allclose(energy, columns["energy"].m_as("kilojoule / mole"))
+        numpy.testing.assert_allclose(position, columns["position"].m_as("angstrom"))
+
+    def test_is_lazy(self, tmp_path, columns):
+        from openff.units.arrow import iter_parquet
+
+        batches = iter_parquet(tmp_path / "missing.parquet")
+
+        with pytest.raises(FileNotFoundError):
+            next(batches)
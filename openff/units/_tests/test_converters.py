@@ -0,0 +1,96 @@
+import numpy
+import pytest
+from pint.errors import DimensionalityError
+
+from openff.units import Quantity, Unit, make_converter, unit
+from openff.units.converters import UnitConverter
+
+
+class TestMakeConverter:
+    @pytest.mark.parametrize(
+        ("src", "dst"),
+        [
+            ("angstrom", "nanometer"),
+            ("kilocalorie / mole", "kilojoule / mole"),
+            ("nanometer / picosecond", "angstrom / femtosecond"),
+            ("degree_Celsius", "kelvin"),
+            ("kelvin", "degree_Celsius"),
+            ("elementary_charge", "elementary_charge"),
+        ],
+    )
+    def test_matches_m_as(self, src, dst):
+        values = numpy.random.default_rng(0).uniform(-100.0, 100.0, size=(10, 3))
+
+        converted = make_converter(src, dst)(values)
+
+        numpy.testing.assert_array_equal(converted, Quantity(values, src).m_as(dst))
+
+    def test_scalar(self):
+        assert make_converter("nanometer", "angstrom")(1.0) == 10.0
+        assert make_converter("degree_Celsius", "kelvin")(0.0) == 273.15
+
+    def test_accepts_units(self):
+        converter = make_converter(unit.angstrom, unit.nanometer)
+
+        assert converter.src == unit.angstrom
+        assert converter.dst == unit.nanometer
+        assert converter.offset == 0.0
+
+    def test_cached(self):
+        assert make_converter("angstrom", "nanometer") is make_converter(
+            Unit("angstrom"),
+            unit.nanometer,
+        )
+
+    @pytest.mark.parametrize(
+        ("src", "dst"),
+        [("angstrom", "nanometer"), ("degree_Celsius", "kelvin")],
+    )
+    def test_out_in_place(self, src, dst):
+        values = numpy.arange(12.0).reshape(4, 3)
+        expected = Quantity(values, src).m_as(dst)
+
+        result = make_converter(src, dst)(values, out=values)
+
+        assert result is values
+        numpy.testing.assert_array_equal(values, expected)
+
+    def test_out_other_array(self):
+        values = numpy.arange(3.0)
+        out = numpy.empty_like(values)
+
+        result = make_converter("nanometer", "angstrom")(values, out=out)
+
+        assert result is out
+        numpy.testing.assert_array_equal(out, [0.0, 10.0, 20.0])
+        numpy.testing.assert_array_equal(values, [0.0, 1.0, 2.0])
+
+    def test_integer_input(self):
+        converted = make_converter("nanometer", "angstrom")(numpy.arange(3))
+
+        assert converted.dtype == numpy.float64
+        numpy.testing.assert_array_equal(converted, [0.0, 10.0, 20.0])
+
+    def test_incompatible_units(self):
+        with pytest.raises(DimensionalityError):
+            make_converter("angstrom", "kilojoule")
+
+    def test_offset_unit_in_compound_unit(self):
+        """Offset units in compound units are treated as differences, as with ``.to()``."""
+        converter = make_converter("degree_Celsius / second", "kelvin / second")
+
+        assert converter.offset == 0.0
+        assert converter(2.0) == Quantity(2.0, "degree_Celsius / second").m_as("kelvin / second")
+
+    def test_rejects_quantities(self):
+        converter = make_converter("angstrom", "nanometer")
+
+        with pytest.raises(TypeError, match="magnitudes"):
+            converter(Quantity(1.0, "angstrom"))
+
+    def test_repr(self):
+        assert isinstance(make_converter("angstrom", "nanometer"), UnitConverter)
+        assert (
+            repr(make_converter("angstrom", "nanometer"))
+            == "UnitConverter(src='angstrom', dst='nanometer')"
+        )
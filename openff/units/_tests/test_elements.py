@@ -1,9 +1,20 @@
 import random
 
+import numpy
 import pytest
 from openff.utilities.testing import skip_if_missing
 
-from openff.units.elements import MASSES, NUMBERS, SYMBOLS
+from openff.units import unit
+from openff.units.elements import (
+    MASSES,
+    NUMBERS,
+    SYMBOLS,
+    element_counts,
+    masses_of,
+    molecular_masses,
+    numbers_of,
+)
+from openff.units.exceptions import UnknownElementSymbolError
 
 
 @skip_if_missing("openmm.unit")
@@ -32,3 +43,201 @@ def test_symbol_roundtrip():
     number = random.randrange(1, 100)
 
     assert NUMBERS[SYMBOLS[number]] == number
+
+
+def test_symbols_do_not_build_registry():
+    """Looking up symbols should not require importing Pint or building the registry."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; "
+        "from openff.units.elements import NUMBERS, SYMBOLS; "
+        "assert NUMBERS[SYMBOLS[6]] == 6; "
+        "assert 'pint' not in sys.modules; "
+        "assert 'openff.units.units' not in sys.modules"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_masses_are_built_once():
+    from openff.units import Quantity, elements
+
+    assert elements.MASSES is elements.MASSES
+    assert len(MASSES) == 116
+    assert all(isinstance(mass, Quantity) for mass in MASSES.values())
+
+
+def test_tables():
+    from openff.units.elements import MASS_TABLE, SYMBOL_TABLE
+
+    assert numpy.isnan(MASS_TABLE[0])
+    assert SYMBOL_TABLE[0] == ""
+
+    for atomic_number in SYMBOLS:
+        assert MASS_TABLE[atomic_number] == MASSES[atomic_number].m
+        assert SYMBOL_TABLE[atomic_number] == SYMBOLS[atomic_number]
+
+    with pytest.raises(ValueError, match="read-only"):
+        MASS_TABLE[1] = 2.0
+
+
+def test_masses_of():
+    atomic_numbers = numpy.random.default_rng().integers(1, 117, size=(10, 5))
+
+    masses = masses_of(atomic_numbers)
+
+    assert masses.units == unit.dalton
+    assert masses.m.dtype == numpy.float64
+    assert masses.m.shape == (10, 5)
+
+    for atomic_number, mass in zip(atomic_numbers.flat, masses.m.flat):
+        assert mass == MASSES[atomic_number].m
+
+
+def test_masses_of_iterables():
+    assert masses_of([6, 1]).m.tolist() == [MASSES[6].m, MASSES[1].m]
+    assert masses_of(range(1, 4)).m.tolist() == [MASSES[1].m, MASSES[2].m, MASSES[3].m]
+    assert masses_of([]).m.shape == (0,)
+
+
+@pytest.mark.parametrize("atomic_numbers", [[1, 0, 6], [1, 117, 200, 117], [-1]])
+def test_masses_of_unknown(atomic_numbers):
+    with pytest.raises(ValueError, match="Unknown atomic numbers"):
+        masses_of(atomic_numbers)
+
+
+def test_masses_of_non_integer():
+    with pytest.raises(TypeError, match="integer"):
+        masses_of([1.0, 6.0])
+
+
+def test_numbers_of():
+    symbols = numpy.array([*NUMBERS.keys()] * 3)
+
+    numpy.testing.assert_equal(numbers_of(symbols), [*NUMBERS.values()] * 3)
+
+
+@pytest.mark.parametrize(
+    "symbols",
+    [
+        ["C", "H", "Cl", "Uub"],
+        ("C", "H", "Cl", "Uub"),
+        (symbol for symbol in ["C", "H", "Cl", "Uub"]),
+        numpy.array(["C", "H", "Cl", "Uub"], dtype=object),
+        numpy.array([b"C", b"H", b"Cl", b"Uub"]),
+    ],
+)
+def test_numbers_of_input_types(symbols):
+    numpy.testing.assert_equal(numbers_of(symbols), [6, 1, 17, 112])
+
+
+def test_numbers_of_shape():
+    symbols = numpy.array([["C", "H"], ["O", "N"]])
+
+    numpy.testing.assert_equal(numbers_of(symbols), [[6, 1], [8, 7]])
+    assert numbers_of([]).shape == (0,)
+
+
+@pytest.mark.parametrize(
+    "symbol",
+    ["Cl", numpy.str_("Cl"), b"Cl", numpy.bytes_(b"Cl"), numpy.array("Cl")],
+)
+def test_numbers_of_scalar(symbol):
+    atomic_number = numbers_of(symbol)
+
+    assert atomic_number.shape == ()
+    assert atomic_number == 17
+
+
+def test_numbers_of_case_insensitive():
+    symbols = ["C", "c", "CL", "cl", "Cl", "uUB"]
+
+    numpy.testing.assert_equal(
+        numbers_of(symbols, case_sensitive=False),
+        [6, 6, 17, 17, 17, 112],
+    )
+
+    with pytest.raises(UnknownElementSymbolError):
+        numbers_of(symbols)
+
+
+def test_numbers_of_reports_all_unknown():
+    symbols = ["C", "X", "H", "Carbon", "", "Uubx", "X"]
+
+    with pytest.raises(UnknownElementSymbolError, match="Found 5 unknown") as error:
+        numbers_of(symbols)
+
+    assert error.value.indices.tolist() == [1, 3, 4, 5, 6]
+    assert error.value.symbols.tolist() == ["X", "Carbon", "", "Uubx", "X"]
+
+
+def test_numbers_of_non_strings():
+    with pytest.raises(TypeError, match="strings"):
+        numbers_of([6, 1])
+
+
+def _random_molecules(n_molecules):
+    sizes = numpy.random.default_rng().integers(0, 20, size=n_molecules)
+    offsets = numpy.concatenate([[0], numpy.cumsum(sizes)])
+    atomic_numbers = numpy.random.default_rng().integers(1, 117, size=offsets[-1])
+
+    return atomic_numbers, offsets
+
+
+def test_molecular_masses():
+    atomic_numbers, offsets = _random_molecules(100)
+
+    masses = molecular_masses(atomic_numbers, offsets)
+
+    assert masses.units == unit.dalton
+    assert masses.m.shape == (100,)
+
+    for index, mass in enumerate(masses.m):
+        molecule = atomic_numbers[offsets[index] : offsets[index + 1]]
+
+        assert mass == pytest.approx(sum(MASSES[number].m for number in molecule))
+
+
+def test_molecular_masses_empty_molecules():
+    masses = molecular_masses([1, 1, 8], [0, 0, 2, 2, 3, 3])
+
+    numpy.testing.assert_allclose(masses.m, [0.0, 2 * MASSES[1].m, 0.0, MASSES[8].m, 0.0])
+
+    assert molecular_masses([], [0]).m.shape == (0,)
+    numpy.testing.assert_equal(molecular_masses([], [0, 0]).m, [0.0])
+
+
+def test_element_counts():
+    atomic_numbers, offsets = _random_molecules(100)
+
+    elements, counts = element_counts(atomic_numbers, offsets)
+
+    numpy.testing.assert_equal(elements, numpy.unique(atomic_numbers))
+    assert counts.shape == (100, len(elements))
+
+    for index, row in enumerate(counts):
+        molecule = atomic_numbers[offsets[index] : offsets[index + 1]]
+
+        assert {int(element): int(count) for element, count in zip(elements, row) if count} == {
+            int(element): int((molecule == element).sum()) for element in set(molecule)
+        }
+
+
+@pytest.mark.parametrize(
+    "offsets",
+    [
+        [],
+        [1, 3],
+        [0, 2],
+        [0, 3, 2, 3],
+        [[0, 3]],
+    ],
+)
+def test_segments_bad_offsets(offsets):
+    with pytest.raises(ValueError, match="offsets"):
+        molecular_masses([1, 1, 8], offsets)
+
+    with pytest.raises(ValueError, match="offsets"):
+        element_counts([1, 1, 8], offsets)
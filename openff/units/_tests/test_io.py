@@ -0,0 +1,146 @@
+import json
+
+import numpy
+import pytest
+
+from openff.units import Quantity, unit
+from openff.units.io import load, save, savez, savez_compressed
+
+
+@pytest.fixture
+def positions():
+    return Quantity(numpy.random.default_rng(0).random((10, 3)), "nanometer")
+
+
+class TestNpy:
+    @pytest.mark.parametrize(
+        "quantity",
+        [
+            Quantity(numpy.arange(6.0).reshape(2, 3), "kilocalorie / mole / angstrom ** 2"),
+            Quantity(numpy.arange(3, dtype=numpy.int32), "dimensionless"),
+            Quantity(1.5, "elementary_charge"),
+            Quantity(numpy.ones(2), "degree_Celsius"),
+        ],
+    )
+    def test_round_trip(self, tmp_path, quantity):
+        save(tmp_path / "quantity.npy", quantity)
+        loaded = load(tmp_path / "quantity.npy")
+
+        assert type(loaded) is Quantity
+        assert loaded._units == quantity._units
+        assert loaded.m.dtype == numpy.asarray(quantity.m).dtype
+        numpy.testing.assert_array_equal(loaded.m, quantity.m)
+
+    def test_files(self, tmp_path, positions):
+        save(tmp_path / "positions", positions)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "positions.npy",
+            "positions.npy.units",
+        ]
+        assert (tmp_path / "positions.npy.units").read_text() == "nanometer"
+        numpy.testing.assert_array_equal(numpy.load(tmp_path / "positions.npy"), positions.m)
+
+    def test_units_are_canonical(self, tmp_path):
+        save(tmp_path / "k.npy", Quantity(numpy.ones(2), "angstrom ** -2 * mole ** -1 * kcal"))
+
+        assert (tmp_path / "k.npy.units").read_text() == "kilocalorie / angstrom ** 2 / mole"
+
+    def test_mmap(self, tmp_path, positions):
+        save(tmp_path / "positions.npy", positions)
+        loaded = load(tmp_path / "positions.npy", mmap_mode="r")
+
+        assert isinstance(loaded.m, numpy.memmap)
+        assert not loaded.m.flags.writeable
+        assert loaded.units == unit.nanometer
+        numpy.testing.assert_allclose(loaded.m_as("angstrom"), positions.m_as("angstrom"))
+
+    def test_mmap_write(self, tmp_path, positions):
+        save(tmp_path / "positions.npy", positions)
+
+        loaded = load(tmp_path / "positions.npy", mmap_mode="r+")
+        loaded.m[0] = 0.0
+        loaded.m.flush()
+        del loaded
+
+        assert numpy.all(load(tmp_path / "positions.npy").m[0] == 0.0)
+
+    def test_missing_units(self, tmp_path, positions):
+        numpy.save(tmp_path / "positions.npy", positions.m)
+
+        with pytest.raises(ValueError, match="No units found"):
+            load(tmp_path / "positions.npy")
+
+    @pytest.mark.parametrize("units", ["not_a_unit", "2 nanometer", "nanometer +"])
+    def test_invalid_units(self, tmp_path, positions, units):
+        save(tmp_path / "positions.npy", positions)
+        (tmp_path / "positions.npy.units").write_text(units)
+
+        with pytest.raises(ValueError, match="invalid units"):
+            load(tmp_path / "positions.npy")
+
+    def test_object_arrays_are_not_saved(self, tmp_path):
+        with pytest.raises(ValueError):
+            save(tmp_path / "objects.npy", Quantity(numpy.array([1.0, None]), "nanometer"))
+
+
+class TestNpz:
+    @pytest.mark.parametrize("function", [savez, savez_compressed])
+    def test_round_trip(self, tmp_path, positions, function):
+        charges = Quantity(numpy.zeros(10), "elementary_charge")
+
+        function(tmp_path / "system.npz", positions=positions, charges=charges)
+        loaded = load(tmp_path / "system.npz")
+
+        assert loaded.keys() == {"positions", "charges"}
+        assert loaded["positions"].units == unit.nanometer
+        assert loaded["charges"].units == unit.elementary_charge
+        numpy.testing.assert_array_equal(loaded["positions"].m, positions.m)
+        numpy.testing.assert_array_equal(loaded["charges"].m, charges.m)
+
+    def test_units_are_not_pickled(self, tmp_path, positions):
+        savez(tmp_path / "system.npz", positions=positions)
+
+        with numpy.load(tmp_path / "system.npz", allow_pickle=False) as archive:
+            assert json.loads(archive["__units__"].item()) == {"positions": "nanometer"}
+
+    def test_mmap(self, tmp_path, positions):
+        savez(tmp_path / "system.npz", positions=positions)
+
+        with pytest.raises(ValueError, match="memory-map"):
+            load(tmp_path / "system.npz", mmap_mode="r")
+
+    def test_reserved_name(self, tmp_path, positions):
+        with pytest.raises(ValueError, match="reserved"):
+            savez(tmp_path / "system.npz", __units__=positions)
+
+    def test_not_quantities(self, tmp_path, positions):
+        with pytest.raises(TypeError, match="Expected a Quantity"):
+            savez(tmp_path / "system.npz", positions=positions.m)
+
+    def test_missing_units(self, tmp_path, positions):
+        numpy.savez(tmp_path / "system.npz", positions=positions.m)
+
+        with pytest.raises(ValueError, match="No units found"):
+            load(tmp_path / "system.npz")
+
+    def test_array_without_units(self, tmp_path, positions):
+        numpy.savez(
+            tmp_path / "system.npz",
+            positions=positions.m,
+            velocities=positions.m,
+            __units__=numpy.array(json.dumps({"positions": "nanometer"})),
+        )
+
+        with pytest.raises(ValueError, match="velocities"):
+            load(tmp_path / "system.npz")
+
+    def test_invalid_units(self, tmp_path, positions):
+        numpy.savez(
+            tmp_path / "system.npz",
+            positions=positions.m,
+            __units__=numpy.array(json.dumps({"positions": "parsec_per_fortnight"})),
+        )
+
+        with pytest.raises(ValueError, match="invalid units"):
+            load(tmp_path / "system.npz")
@@ -10,9 +10,13 @@ if has_package("openmm.unit"):
     from openmm import unit as openmm_unit
 
     from openff.units.openmm import (
+        from_openmm_many,
         openmm_unit_to_string,
+        positions_from_openmm,
+        positions_to_openmm,
         string_to_openmm_unit,
         to_openmm,
+        to_openmm_many,
     )
 
     openmm_quantitites = [
@@ -178,6 +182,202 @@ class TestOpenMMUnits:
         )
 
 
+@skip_if_missing("openmm.unit")
+class TestSharedMemory:
+    def test_to_openmm_shares_memory(self):
+        import numpy
+
+        positions = numpy.random.default_rng().random((100, 3))
+
+        converted = to_openmm(Quantity(positions, "nanometer"))
+
+        assert numpy.shares_memory(converted._value, positions)
+        assert converted.unit == openmm_unit.nanometer
+
+    def test_from_openmm_shares_memory(self):
+        import numpy
+
+        positions = numpy.random.default_rng().random((100, 3))
+
+        converted = from_openmm(openmm_unit.Quantity(positions, openmm_unit.nanometer))
+
+        assert numpy.shares_memory(converted.m, positions)
+        assert converted.units == unit.nanometer
+
+    def test_many_share_memory(self):
+        import numpy
+
+        positions = numpy.random.default_rng().random((100, 3))
+
+        (converted,) = to_openmm_many([Quantity(positions, "angstrom")])
+        (roundtripped,) = from_openmm_many([converted])
+
+        assert numpy.shares_memory(converted._value, positions)
+        assert numpy.shares_memory(roundtripped.m, positions)
+
+    def test_base_unit_conversion_copies(self):
+        import numpy
+
+        values = numpy.random.default_rng().random(10)
+
+        converted = to_openmm(Quantity(values, "kayser"))
+
+        assert not numpy.shares_memory(converted._value, values)
+        numpy.testing.assert_allclose(converted._value, 100 * values)
+
+
+@skip_if_missing("openmm.unit")
+class TestPositions:
+    def test_positions_from_vec3_list(self):
+        import numpy
+        from openmm import Vec3
+
+        array = numpy.random.default_rng().random((50, 3))
+        vectors = [Vec3(*row) for row in array] * openmm_unit.angstrom
+
+        positions = positions_from_openmm(vectors)
+
+        assert positions.units == unit.angstrom
+        assert positions.m.dtype == numpy.float64
+        assert positions.m.shape == (50, 3)
+        assert positions.m.flags.c_contiguous
+        numpy.testing.assert_equal(positions.m, array)
+
+    def test_positions_from_list_of_quantities(self):
+        import numpy
+        from openmm import Vec3
+
+        vectors = [Vec3(0.0, 1.0, 2.0) * openmm_unit.nanometer] * 4
+
+        positions = positions_from_openmm(vectors)
+
+        assert positions.units == unit.nanometer
+        numpy.testing.assert_equal(positions.m, [[0.0, 1.0, 2.0]] * 4)
+
+    def test_positions_from_array_shares_memory(self):
+        import numpy
+
+        array = numpy.random.default_rng().random((50, 3))
+
+        positions = positions_from_openmm(openmm_unit.Quantity(array, openmm_unit.nanometer))
+
+        assert numpy.shares_memory(positions.m, array)
+
+    def test_from_openmm_vec3_fast_path(self):
+        import numpy
+        from openmm import Vec3
+
+        vectors = [Vec3(0.0, 1.0, 2.0), Vec3(3.0, 4.0, 5.0)] * openmm_unit.nanometer
+
+        converted = from_openmm(vectors)
+
+        assert converted.m.dtype == numpy.float64
+        numpy.testing.assert_equal(converted.m, [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+
+    def test_positions_to_openmm(self):
+        import numpy
+
+        array = numpy.random.default_rng().random((50, 3))
+
+        converted = positions_to_openmm(Quantity(array, "angstrom"))
+
+        assert converted.unit == openmm_unit.nanometer
+        assert isinstance(converted._value, numpy.ndarray)
+        assert converted._value.flags.c_contiguous
+        numpy.testing.assert_allclose(converted._value, array / 10)
+
+        assert numpy.shares_memory(
+            positions_to_openmm(Quantity(array, "nanometer"))._value,
+            array,
+        )
+
+    def test_positions_roundtrip(self):
+        import numpy
+
+        positions = Quantity(numpy.random.default_rng().random((50, 3)), "nanometer")
+
+        assert numpy.all(positions_from_openmm(positions_to_openmm(positions)) == positions)
+
+    def test_positions_bad_shape(self):
+        import numpy
+
+        with pytest.raises(ValueError, match=r"shape \(N, 3\)"):
+            positions_to_openmm(Quantity(numpy.zeros((4, 2)), "nanometer"))
+
+        with pytest.raises(ValueError, match=r"shape \(N, 3\)"):
+            positions_from_openmm(openmm_unit.Quantity(numpy.zeros((2, 6)), openmm_unit.nanometer))
+
+    def test_positions_from_empty(self):
+        assert positions_from_openmm([] * openmm_unit.nanometer).m.shape == (0, 3)
+
+    def test_positions_none(self):
+        with pytest.raises(NoneQuantityError):
+            positions_from_openmm(None)
+
+        with pytest.raises(NoneQuantityError):
+            positions_to_openmm(None)
+
+
+@skip_if_missing("openmm.unit")
+class TestManyConversions:
+    def test_to_openmm_many_matches_scalar(self):
+        quantities = [*pint_quantities, 2.0 * unit.kayser, *pint_quantities[::-1]]
+
+        assert to_openmm_many(quantities) == [to_openmm(q) for q in quantities]
+
+    def test_from_openmm_many_matches_scalar(self):
+        quantities = [*openmm_quantitites, *openmm_quantitites[::-1]]
+
+        assert from_openmm_many(quantities) == [from_openmm(q) for q in quantities]
+
+    def test_from_openmm_many_vec3_fast_path(self, monkeypatch):
+        import numpy
+        from openmm import Vec3
+
+        from openff.units import openmm as openff_openmm
+
+        calls = []
+        flatten = openff_openmm._vec3_list_to_array
+        monkeypatch.setattr(
+            openff_openmm,
+            "_vec3_list_to_array",
+            lambda vectors: calls.append(vectors) or flatten(vectors),
+        )
+
+        vectors = [Vec3(0.0, 1.0, 2.0), Vec3(3.0, 4.0, 5.0)] * openmm_unit.nanometer
+
+        (converted,) = from_openmm_many([vectors])
+
+        assert len(calls) == 1
+        assert converted.m.dtype == numpy.float64
+        numpy.testing.assert_equal(converted.m, from_openmm(vectors).m)
+
+    def test_many_accept_generators(self):
+        assert to_openmm_many(q for q in pint_quantities) == openmm_quantitites
+        assert from_openmm_many(q for q in openmm_quantitites) == pint_quantities
+
+    def test_many_mappings(self):
+        openff_parameters = {
+            "k": Quantity(500.0, "kilocalorie / mole / angstrom ** 2"),
+            "length": Quantity(1.5, "angstrom"),
+            "angle": Quantity(109.5, "degree"),
+        }
+
+        openmm_parameters = to_openmm_many(openff_parameters)
+
+        assert [*openmm_parameters.keys()] == [*openff_parameters.keys()]
+        assert openmm_parameters["length"] == 1.5 * openmm_unit.angstrom
+
+        assert from_openmm_many(openmm_parameters) == openff_parameters
+
+    def test_many_none(self):
+        with pytest.raises(NoneQuantityError):
+            to_openmm_many([Quantity(1.0, "angstrom"), None])
+
+        with pytest.raises(NoneQuantityError):
+            from_openmm_many([1.0 * openmm_unit.angstrom, None])
+
+
 @skip_if_missing("openmm.unit")
 class TestEnsureType:
     from openff.units import unit
@@ -236,3 +436,102 @@ class TestEnsureType:
             numpy.array(ensure_quantity(value, "openmm")),
             numpy.array(openmm_unit.Quantity(value, openmm_unit.dimensionless)),
         )
+
+    @pytest.mark.parametrize("type_to_ensure", ["openmm", "openff"])
+    def test_other_openmm_types(self, type_to_ensure):
+        from openmm import Vec3
+
+        for value in [openmm_unit.angstrom, Vec3(1.0, 2.0, 3.0)]:
+            with pytest.raises(ValueError, match="Failed to process input of type"):
+                ensure_quantity(value, type_to_ensure)
+
+    def test_subclasses_dispatch_to_parent_handler(self):
+        class LengthQuantity(openmm_unit.Quantity):
+            pass
+
+        length = LengthQuantity(4.0, openmm_unit.angstrom)
+
+        # repeat to go through the cached handler
+        for _ in range(2):
+            assert ensure_quantity(length, "openmm") is length
+            assert ensure_quantity(length, "openff") == Quantity(4.0, "angstrom")
+
+    def test_handlers_registered_later_are_used(self):
+        from openff.units.openmm import _ensure_openff_quantity
+
+        class Length:
+            pass
+
+        assert ensure_quantity(Length(), "openff").units == unit.dimensionless
+
+        @_ensure_openff_quantity.register
+        def _(unknown_quantity: Length) -> Quantity:
+            return Quantity(4.0, "angstrom")
+
+        assert ensure_quantity(Length(), "openff") == Quantity(4.0, "angstrom")
+
+
+@skip_if_missing("openmm.unit")
+class TestUnitCaches:
+    def test_to_openmm_reuses_cached_unit(self, monkeypatch):
+        from openff.units import openmm as openff_openmm
+
+        openff_openmm._openff_units_to_openmm_unit.cache_clear()
+
+        first = to_openmm(Quantity(1.0, "kilocalorie / mole / angstrom ** 2"))
+
+        def fail(unit_string):
+            raise AssertionError("unit string should not be parsed again")
+
+        monkeypatch.setattr(openff_openmm, "string_to_openmm_unit", fail)
+
+        second = to_openmm(Quantity(2.0, "kilocalorie / mole / angstrom ** 2"))
+
+        assert second.unit is first.unit
+        assert second == 2.0 * openmm_unit.kilocalorie_per_mole / openmm_unit.angstrom**2
+
+        cache_info = openff_openmm._openff_units_to_openmm_unit.cache_info()
+
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+        assert cache_info.maxsize is not None
+
+    def test_from_openmm_reuses_cached_unit(self, monkeypatch):
+        from openff.units import openmm as openff_openmm
+
+        openff_openmm._openmm_unit_to_openff_unit.cache_clear()
+
+        first = from_openmm(1.0 * openmm_unit.kilojoule_per_mole / openmm_unit.nanometer**2)
+
+        def fail(input_unit):
+            raise AssertionError("unit should not be serialized again")
+
+        monkeypatch.setattr(openff_openmm, "openmm_unit_to_string", fail)
+
+        second = from_openmm(2.0 * openmm_unit.kilojoule_per_mole / openmm_unit.nanometer**2)
+
+        assert second._units is first._units
+        assert second == Quantity(2.0, "kilojoule / mole / nanometer ** 2")
+
+        cache_info = openff_openmm._openmm_unit_to_openff_unit.cache_info()
+
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+
+    def test_missing_openmm_unit_is_remembered(self, monkeypatch):
+        from openff.units import openmm as openff_openmm
+
+        openff_openmm._openff_units_to_openmm_unit.cache_clear()
+
+        first = to_openmm(Quantity(2.0, "kayser"))
+
+        assert openff_openmm._openff_units_to_openmm_unit(unit.kayser._units) is None
+
+        def fail(unit_string):
+            raise AssertionError("missing units should not be looked up again")
+
+        monkeypatch.setattr(openff_openmm, "string_to_openmm_unit", fail)
+
+        second = to_openmm(Quantity(2.0, "kayser"))
+
+        assert first == second == 200.0 / openmm_unit.meter
@@ -0,0 +1,256 @@
+import math
+
+import numpy
+import pytest
+
+from openff.units import DEFAULT_UNIT_REGISTRY, Quantity, unit
+from openff.units.parsing import convert_all_strings_to_quantity, string_to_quantity
+
+
+def _parse_in_full(string):
+    """The result of parsing ``string`` with ``Quantity(string)``, as done downstream."""
+    try:
+        quantity = Quantity(string)
+    except Exception:
+        return string
+
+    if quantity.units == unit.dimensionless and isinstance(quantity.m, int | float):
+        return quantity.m
+
+    return quantity
+
+
+class TestStringToQuantity:
+    @pytest.mark.parametrize(
+        "string",
+        [
+            "1.0 * angstrom",
+            "1.0 angstrom",
+            "  1.0 * nanometer  ",
+            "2 * kilocalorie / mole",
+            "2 kcal/mol",
+            "-1.5 * elementary_charge",
+            ".5 * nm",
+            "2nm",
+            "2eV",
+            "1.0 * angstrom**-2",
+            "1 nm ** - 2",
+            "1.0 * angstrom^-2",
+            "1.0 * mole**-1 * kilocalorie",
+            "1.0 * kilocalorie_per_mole / radian ** 2",
+            "5 * (kcal / mol)",
+            "2 * nm squared",
+            "1 kilocalorie per mole",
+            "1.0*nm*1/2",
+            "2 / nm",
+            "2 * kcal + 3 * kcal",
+            "2 3",
+            "2 ** 3",
+            "angstrom",
+            "kcal/mol",
+            "°C",
+            "A",
+            "4",
+            "+3",
+            "-0.5",
+            "12.",
+            "1e3",
+            "1.2e-3",
+            "1_000",
+            "007",
+            "0.4.0",
+            "1-4",
+            "nan",
+            "0.5 * dimensionless",
+            "[#6X4:1]-[#1:2]",
+            "[*:1]~[#6:2]",
+            "Electrostatics",
+            "PME",
+            "hello world",
+            "a, b",
+            "x=1",
+            "k1",
+            "",
+            "   ",
+            "Lorentz-Berthelot",
+            "-",
+            "*",
+            "* nm",
+            "1.5 *",
+            "1.0 * (nm",
+        ],
+    )
+    def test_same_as_full_parse(self, string):
+        result = string_to_quantity(string)
+        expected = _parse_in_full(string)
+
+        assert type(result) is type(expected)
+
+        if isinstance(expected, Quantity):
+            assert type(result.m) is type(expected.m)
+            assert result.units == expected.units
+            assert result.m == expected.m
+        elif isinstance(expected, float) and math.isnan(expected):
+            assert math.isnan(result)
+        else:
+            assert result == expected
+
+    def test_dimensionless_numbers(self):
+        assert string_to_quantity("4") == 4
+        assert type(string_to_quantity("4")) is int
+        assert type(string_to_quantity("4.0")) is float
+
+    @pytest.mark.parametrize("string", ["1:2", "[#1:1]", "#comment", "{x}"])
+    def test_not_quantities(self, string):
+        assert string_to_quantity(string) == string
+
+    def test_offset_units(self):
+        quantity = string_to_quantity("25 * degC")
+
+        assert quantity.units == unit.degree_Celsius
+        assert quantity.m == 25
+
+    def test_unit_expressions_are_cached(self):
+        DEFAULT_UNIT_REGISTRY.clear_parse_cache()
+
+        for index in range(10):
+            string_to_quantity(f"{index} * angstrom")
+            string_to_quantity("Electrostatics")
+
+        info = DEFAULT_UNIT_REGISTRY.parse_cache_info()
+
+        assert info.misses == 2
+        assert info.hits == 18
+
+    def test_results_are_independent(self):
+        first = string_to_quantity("1.0 * angstrom")
+        first.ito("nanometer")
+
+        assert string_to_quantity("1.0 * angstrom").units == unit.angstrom
+
+
+class TestConvertAllStringsToQuantity:
+    def test_nested(self):
+        data = {
+            "version": "0.3",
+            "Bonds": {
+                "potential": "harmonic",
+                "Bond": [
+                    {
+                        "smirks": "[#6:1]-[#6:2]",
+                        "length": "1.5 * angstrom",
+                        "k": "500.0 * kcal/mol",
+                    },
+                    {"smirks": "[#6:1]-[#1:2]", "length": "1.09 * angstrom", "id": "b2"},
+                ],
+            },
+            "cutoff": 9.0,
+            "periodicity": 3,
+            "empty": None,
+        }
+
+        converted = convert_all_strings_to_quantity(data, ignore_keys=["version"])
+
+        assert converted is data
+        assert data["version"] == "0.3"
+        assert data["Bonds"]["potential"] == "harmonic"
+        assert data["Bonds"]["Bond"][0] == {
+            "smirks": "[#6:1]-[#6:2]",
+            "length": Quantity(1.5, "angstrom"),
+            "k": Quantity(500.0, "kcal/mol"),
+        }
+        assert data["Bonds"]["Bond"][1]["id"] == "b2"
+        assert data["cutoff"] == 9.0
+        assert data["periodicity"] == 3
+        assert data["empty"] is None
+
+    def test_ignored_keys_are_not_searched(self):
+        data = {"ignored": ["1.0 * angstrom"], "other": ["1.0 * angstrom"]}
+
+        convert_all_strings_to_quantity(data, ignore_keys=("ignored",))
+
+        assert data == {"ignored": ["1.0 * angstrom"], "other": [Quantity(1.0, "angstrom")]}
+
+    def test_other_objects_are_unchanged(self):
+        quantity = Quantity(numpy.ones(3), "nanometer")
+
+        assert convert_all_strings_to_quantity(quantity) is quantity
+        assert convert_all_strings_to_quantity("2 * nanometer") == Quantity(2, "nanometer")
+
+
+class TestFromStrings:
+    def test_same_units(self):
+        quantity = Quantity.from_strings(["1.5 * angstrom", "1.7 * angstrom", "-2 angstrom"])
+
+        assert type(quantity) is Quantity
+        assert quantity.units == unit.angstrom
+        assert quantity.m.dtype == numpy.float64
+        assert quantity.m.flags.c_contiguous
+        numpy.testing.assert_array_equal(quantity.m, [1.5, 1.7, -2.0])
+
+    def test_compatible_units(self):
+        quantity = Quantity.from_strings(["1.5 * angstrom", "0.2 * nanometer", "1 * angstrom"])
+
+        assert quantity.units == unit.angstrom
+        numpy.testing.assert_allclose(quantity.m, [1.5, 2.0, 1.0])
+
+    def test_target_units(self):
+        quantity = Quantity.from_strings(["1 * kcal/mol", "4.184 * kJ/mol"], units="kJ/mol")
+
+        assert quantity.units == unit.kilojoule / unit.mole
+        numpy.testing.assert_allclose(quantity.m, [4.184, 4.184])
+
+    def test_offset_units(self):
+        quantity = Quantity.from_strings(["25 * degC", "300 * kelvin", "0 °C"], units="kelvin")
+
+        numpy.testing.assert_allclose(quantity.m, [298.15, 300.0, 273.15])
+
+    def test_expressions(self):
+        quantity = Quantity.from_strings(["2 / nanometer", "1 nanometer ** -1", "3 * nm**-1/2"])
+
+        assert quantity.units == unit.nanometer**-1
+        numpy.testing.assert_allclose(quantity.m, [2.0, 1.0, 1.5])
+
+    def test_dimensionless(self):
+        quantity = Quantity.from_strings(["4", "0.5", "1 * dimensionless"])
+
+        assert quantity.units == unit.dimensionless
+        numpy.testing.assert_array_equal(quantity.m, [4.0, 0.5, 1.0])
+
+    def test_matches_stacking(self):
+        strings = [f"{index * 0.1} * kilocalorie / mole" for index in range(100)]
+
+        numpy.testing.assert_array_equal(
+            Quantity.from_strings(strings).m,
+            [Quantity(string).m for string in strings],
+        )
+
+    def test_iterables(self):
+        quantity = Quantity.from_strings(f"{index} * angstrom" for index in range(3))
+
+        numpy.testing.assert_array_equal(quantity.m, [0.0, 1.0, 2.0])
+
+    def test_empty(self):
+        quantity = Quantity.from_strings([], units="angstrom")
+
+        assert quantity.units == unit.angstrom
+        assert quantity.m.shape == (0,)
+
+        with pytest.raises(ValueError, match="empty"):
+            Quantity.from_strings([])
+
+    @pytest.mark.parametrize("string", ["PME", "[#6:1]", "1.0 * not_a_unit", ""])
+    def test_not_quantities(self, string):
+        with pytest.raises(ValueError, match="Cannot parse"):
+            Quantity.from_strings(["1.0 * angstrom", string])
+
+    @pytest.mark.parametrize("strings", ["1.0 * angstrom", b"1.0 * angstrom", "4"])
+    def test_single_string(self, strings):
+        with pytest.raises(TypeError, match="single"):
+            Quantity.from_strings(strings)
+
+    def test_incompatible_units(self):
+        from pint.errors import DimensionalityError
+
+        with pytest.raises(DimensionalityError):
+            Quantity.from_strings(["1.0 * angstrom", "1.0 * kcal/mol"])
@@ -0,0 +1,137 @@
+import json
+
+import numpy
+import pytest
+
+from openff.units import Quantity, unit
+from openff.units.serialization import decode_tree, encode_tree, from_dict, to_dict
+
+
+class TestToDict:
+    def test_scalar(self):
+        assert to_dict(Quantity(1.5, "kcal/mol")) == {"value": 1.5, "unit": "kilocalorie / mole"}
+
+    def test_numpy_scalars(self):
+        assert to_dict(Quantity(numpy.float32(0.5), "nanometer")) == {
+            "value": 0.5,
+            "unit": "nanometer",
+        }
+        assert to_dict(Quantity(numpy.array(2), "nanometer")) == {"value": 2, "unit": "nanometer"}
+
+    def test_canonical_units(self):
+        assert (
+            to_dict(Quantity(1.0, "kcal/mol/angstrom**2"))["unit"]
+            == to_dict(Quantity(1.0, "kcal/angstrom**2/mol"))["unit"]
+        )
+
+    def test_list_encoding(self):
+        data = to_dict(Quantity(numpy.arange(6.0).reshape(2, 3), "angstrom"))
+
+        assert data == {"value": [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]], "unit": "angstrom"}
+
+    def test_base64_encoding(self):
+        data = to_dict(Quantity(numpy.arange(6.0).reshape(2, 3), "angstrom"), "base64")
+
+        assert data["unit"] == "angstrom"
+        assert data["value"]["dtype"] == "<f8"
+        assert data["value"]["shape"] == [2, 3]
+        assert isinstance(data["value"]["data"], str)
+
+    def test_unknown_encoding(self):
+        with pytest.raises(ValueError, match="Unsupported array encoding"):
+            to_dict(Quantity(numpy.zeros(2), "angstrom"), "pickle")
+
+    def test_object_arrays(self):
+        with pytest.raises(ValueError, match="Python objects"):
+            to_dict(Quantity(numpy.array([1.0, None]), "angstrom"), "base64")
+
+
+class TestFromDict:
+    @pytest.mark.parametrize("encoding", ["list", "base64"])
+    @pytest.mark.parametrize(
+        "quantity",
+        [
+            Quantity(1.5, "kilocalorie / mole / angstrom ** 2"),
+            Quantity(3, "dimensionless"),
+            Quantity(numpy.arange(6.0).reshape(2, 3), "nanometer"),
+            Quantity(numpy.arange(6, dtype=numpy.int32).reshape(2, 3).T, "elementary_charge"),
+            Quantity(numpy.ones(2), "degree_Celsius"),
+        ],
+    )
+    def test_round_trip(self, quantity, encoding):
+        loaded = from_dict(json.loads(json.dumps(to_dict(quantity, encoding))))
+
+        assert type(loaded) is Quantity
+        assert loaded._units == quantity._units
+        numpy.testing.assert_array_equal(loaded.m, quantity.m)
+
+    def test_base64_preserves_dtype(self):
+        quantity = Quantity(numpy.arange(4, dtype=numpy.float32), "angstrom")
+        loaded = from_dict(to_dict(quantity, "base64"))
+
+        assert loaded.m.dtype == numpy.float32
+        assert loaded.m.flags.writeable
+
+    def test_base64_preserves_empty_shape(self):
+        loaded = from_dict(to_dict(Quantity(numpy.empty((0, 3)), "nanometer"), "base64"))
+
+        assert loaded.m.shape == (0, 3)
+
+    def test_lists_become_arrays(self):
+        loaded = from_dict({"value": [1.0, 2.0], "unit": "angstrom"})
+
+        assert isinstance(loaded.m, numpy.ndarray)
+
+    def test_units_are_interned(self):
+        first = from_dict({"value": 1.0, "unit": "kilocalorie / mole"})
+        second = from_dict({"value": 2.0, "unit": "kilocalorie / mole"})
+
+        assert first._units is second._units
+
+    @pytest.mark.parametrize("units", ["not_a_unit", "2 * angstrom"])
+    def test_invalid_units(self, units):
+        with pytest.raises(ValueError, match="Invalid units"):
+            from_dict({"value": 1.0, "unit": units})
+
+
+class TestTree:
+    @pytest.fixture
+    def tree(self):
+        return {
+            "name": "water",
+            "bonds": [
+                {"id": "b1", "length": Quantity(0.9572, "angstrom")},
+                {"id": "b2", "k": Quantity(1000.0, "kcal/mol/angstrom**2")},
+            ],
+            "box": Quantity(numpy.eye(3) * 3.0, "nanometer"),
+            "charges": (Quantity(-0.834, "elementary_charge"), 0.417),
+            "count": 3,
+            "empty": None,
+        }
+
+    @pytest.mark.parametrize("encoding", ["list", "base64"])
+    def test_round_trip(self, tree, encoding):
+        loaded = decode_tree(json.loads(json.dumps(encode_tree(tree, encoding))))
+
+        assert loaded["name"] == "water"
+        assert loaded["count"] == 3
+        assert loaded["empty"] is None
+        assert loaded["bonds"][0] == {"id": "b1", "length": Quantity(0.9572, "angstrom")}
+        assert loaded["bonds"][1]["k"] == Quantity(1000.0, "kcal/mol/angstrom**2")
+        assert loaded["charges"] == [Quantity(-0.834, "elementary_charge"), 0.417]
+        assert loaded["box"].units == unit.nanometer
+        numpy.testing.assert_array_equal(loaded["box"].m, tree["box"].m)
+
+    def test_encode_does_not_modify_input(self, tree):
+        encode_tree(tree)
+
+        assert isinstance(tree["box"], Quantity)
+
+    def test_other_dicts_are_not_quantities(self):
+        tree = {
+            "a": {"value": 1.0, "unit": "angstrom", "note": "extra key"},
+            "b": {"value": 1.0, "units": "angstrom"},
+            "c": {"value": 1.0, "unit": None},
+        }
+
+        assert decode_tree(tree) == tree
@@ -0,0 +1,132 @@
+import gc
+import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy
+import pytest
+
+from openff.units import Quantity, share, unit
+from openff.units.shared_memory import SharedQuantity
+
+
+def _summarize(handle: SharedQuantity) -> tuple[float, str, bool]:
+    quantity = handle.attach()
+
+    return float(quantity.m_as("angstrom").sum()), str(quantity.units), quantity.m.flags.writeable
+
+
+@pytest.fixture
+def positions():
+    return Quantity(numpy.random.default_rng(0).random((100, 3)), "nanometer")
+
+
+class TestShare:
+    def test_attach(self, positions):
+        with share(positions) as handle:
+            shared = handle.attach()
+
+            assert shared.units == unit.nanometer
+            assert shared.m.dtype == positions.m.dtype
+            numpy.testing.assert_array_equal(shared.m, positions.m)
+
+    def test_attached_quantities_are_read_only_views(self, positions):
+        with share(positions) as handle:
+            first = handle.attach()
+            second = pickle.loads(pickle.dumps(handle)).attach()
+
+            assert not first.m.flags.writeable
+            assert not first.m.flags.owndata
+            assert not numpy.shares_memory(first.m, positions.m)
+
+            with pytest.raises(ValueError, match="read-only"):
+                first.m[0, 0] = 1.0
+
+            numpy.testing.assert_array_equal(first.m, second.m)
+
+    @pytest.mark.parametrize(
+        "quantity",
+        [
+            Quantity(1.5, "kilocalorie / mole"),
+            Quantity(numpy.arange(6, dtype=numpy.int32).reshape(2, 3).T, "angstrom"),
+            Quantity(numpy.empty((0, 3)), "nanometer"),
+            Quantity(numpy.ones(3), "degree_Celsius"),
+        ],
+    )
+    def test_round_trip(self, quantity):
+        with share(quantity) as handle:
+            shared = handle.attach()
+
+            assert shared._units == quantity._units
+            numpy.testing.assert_array_equal(shared.m, quantity.m)
+
+    def test_object_arrays(self):
+        with pytest.raises(ValueError, match="Python objects"):
+            share(Quantity(numpy.array([1.0, None]), "nanometer"))
+
+    def test_pickled_handle_is_small(self):
+        handle = share(Quantity(numpy.zeros((100_000, 3)), "nanometer"))
+
+        try:
+            assert len(pickle.dumps(handle)) < 1000
+        finally:
+            handle.close()
+            handle.unlink()
+
+    def test_process_pool(self, positions):
+        expected = float(positions.m_as("angstrom").sum())
+
+        with share(positions) as handle:
+            with ProcessPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(_summarize, [handle] * 4))
+
+            # Workers attaching to the segment and exiting must not free it
+            shared = handle.attach()
+            numpy.testing.assert_array_equal(shared.m, positions.m)
+
+        for total, units, writeable in results:
+            assert total == pytest.approx(expected)
+            assert units == "nanometer"
+            assert not writeable
+
+
+class TestLifecycle:
+    def test_context_manager_unlinks(self, positions):
+        with share(positions) as handle:
+            pass
+
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=handle.name)
+
+    def test_attached_quantities_outlive_handle(self, positions):
+        with share(positions) as handle:
+            shared = handle.attach()
+            view = handle.attach().m[10:20]
+
+        numpy.testing.assert_array_equal(shared.m, positions.m)
+        numpy.testing.assert_array_equal(view, positions.m[10:20])
+
+    def test_segment_is_closed_with_last_array(self, positions):
+        with share(positions) as handle:
+            shared = handle.attach()
+            segment = weakref.ref(shared.m.base.segment)
+            view = shared.m[10:20]
+
+            del shared
+            gc.collect()
+            assert segment() is not None
+
+            del view
+            gc.collect()
+            assert segment() is None
+
+    def test_only_owner_can_unlink(self, positions):
+        with share(positions) as handle:
+            copy = pickle.loads(pickle.dumps(handle))
+
+            assert handle.owner
+            assert not copy.owner
+
+            with pytest.raises(ValueError, match="Only the handle"):
+                copy.unlink()
@@ -1,10 +1,12 @@
 import pickle
 import random
 
+import numpy
 import pytest
 from openff.utilities.testing import skip_if_missing
 
-from openff.units import Quantity, unit
+from openff.units import Measurement, Quantity, Unit, unit
+from openff.units.units import DEFAULT_UNIT_REGISTRY, _build_default_registry
 
 
 class TestQuantity:
@@ -21,6 +23,43 @@ class TestQuantity:
 
         assert converted == openmm_unit.Quantity(0.5, openmm_unit.nanometer)
 
+    @pytest.mark.parametrize(
+        "magnitude",
+        [1, 1.5, numpy.arange(4.0), [1.0, 2.0], (1.0, 2.0)],
+    )
+    @pytest.mark.parametrize(
+        "units",
+        ["kilocalorie / mole", unit.kilocalorie / unit.mole, Unit("kilocalorie / mole")],
+    )
+    def test_from_magnitude(self, magnitude, units):
+        quantity = Quantity.from_magnitude(magnitude, units)
+        expected = Quantity(magnitude, units)
+
+        assert type(quantity) is type(expected)
+        assert quantity.units == expected.units
+        assert type(quantity.m) is type(expected.m)
+        assert numpy.all(quantity == expected)
+
+    def test_from_magnitude_behaves_like_quantity(self):
+        quantity = Quantity.from_magnitude(numpy.ones(3), unit.angstrom)
+
+        numpy.testing.assert_allclose(quantity.m_as("nanometer"), 0.1)
+        assert numpy.all(quantity + Quantity(1.0, "nanometer") == Quantity(11.0, "angstrom"))
+
+    def test_from_magnitude_other_registry(self):
+        from openff.units.units import UnitRegistry
+        from openff.units.utilities import get_defaults_path
+
+        other = UnitRegistry(get_defaults_path())
+
+        with pytest.raises(ValueError, match="different registry"):
+            Quantity.from_magnitude(1.0, other.angstrom)
+
+    def test_registry_uses_openff_classes(self):
+        # Pint subclasses the classes defined in openff.units.units for each registry
+        assert Quantity.__mro__[1].__module__ == "openff.units.units"
+        assert Unit.__mro__[1].__module__ == "openff.units.units"
+
 
 class TestPickle:
     """Test pickle-based serialization of Quantity, Unit, and Measurement objects
@@ -50,6 +89,249 @@ class TestPickle:
 
         assert x.value == y.value and x.error == y.error
 
+    @pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+    @pytest.mark.parametrize(
+        "quantity",
+        [
+            Quantity(1.5, "kilocalorie / mole / angstrom ** 2"),
+            Quantity(numpy.arange(6.0).reshape(2, 3), "nanometer"),
+            Quantity(numpy.arange(6.0).reshape(2, 3).T, "nanometer"),
+            Quantity(numpy.arange(6.0)[::2], "nanometer"),
+            Quantity(2, "dimensionless"),
+            Quantity(1.0, "degree_Celsius"),
+            Quantity(1.0, "delta_degree_Celsius / second"),
+            Quantity(1.0, "nanometer ** 0.5"),
+        ],
+    )
+    def test_round_trip(self, quantity, protocol):
+        loaded = pickle.loads(pickle.dumps(quantity, protocol=protocol))
+
+        assert type(loaded) is Quantity
+        assert loaded._units == quantity._units
+        numpy.testing.assert_array_equal(loaded.m, quantity.m)
+
+    def test_out_of_band_round_trip_is_zero_copy(self):
+        array = numpy.random.default_rng(0).random((1000, 3))
+        buffers = []
+
+        payload = pickle.dumps(
+            Quantity(array, "angstrom"),
+            protocol=5,
+            buffer_callback=buffers.append,
+        )
+        loaded = pickle.loads(payload, buffers=buffers)
+
+        assert len(buffers) == 1
+        assert numpy.shares_memory(loaded.m, array)
+        assert loaded.units == unit.angstrom
+
+    def test_out_of_band_payload_is_small(self):
+        quantity = Quantity(numpy.zeros((100_000, 3)), "angstrom")
+
+        in_band = pickle.dumps(quantity, protocol=5)
+        out_of_band = pickle.dumps(quantity, protocol=5, buffer_callback=lambda buffer: None)
+
+        assert len(in_band) > quantity.m.nbytes
+        assert len(out_of_band) < 1000
+
+    def test_units_are_pickled_as_string(self):
+        import pint
+
+        quantity = Quantity(1.5, "kilocalorie / mole / angstrom ** 2")
+        default = pickle.dumps(pint.Quantity.__reduce__(quantity))
+
+        assert b"UnitsContainer" not in pickle.dumps(quantity)
+        assert len(pickle.dumps(quantity)) < len(default)
+
+    def test_equal_units_are_pickled_the_same_way(self):
+        first = Quantity(1.5, "kilocalorie / mole / angstrom ** 2")
+        second = Quantity(1.5, "angstrom ** -2 * mole ** -1 * kilocalorie")
+
+        assert first.__reduce_ex__(5) == second.__reduce_ex__(5)
+
+    @pytest.mark.parametrize("default_format", ["~L", "L", "~P", "~"])
+    def test_pickling_ignores_default_format(self, default_format):
+        from openff.units.units import _format_units
+
+        quantity = Quantity(1.5, "kilocalorie / mole / angstrom ** 2")
+        previous = DEFAULT_UNIT_REGISTRY.formatter.default_format
+        _format_units.cache_clear()
+
+        try:
+            DEFAULT_UNIT_REGISTRY.formatter.default_format = default_format
+
+            assert quantity.__reduce_ex__(5)[1][1] == "kilocalorie / angstrom ** 2 / mole"
+            assert pickle.loads(pickle.dumps(quantity)) == quantity
+        finally:
+            DEFAULT_UNIT_REGISTRY.formatter.default_format = previous
+
+    @skip_if_missing("uncertainties")
+    def test_measurement_units_are_pickled_as_string(self):
+        x = Measurement(1.0, 0.1, "nanometer")
+        y = pickle.loads(pickle.dumps(x))
+
+        assert type(y) is Measurement
+        assert b"UnitsContainer" not in pickle.dumps(x)
+        assert x.value == y.value and x.error == y.error
+
+
+@skip_if_missing("dask")
+class TestDaskTokenize:
+    def test_equal_quantities_share_token(self):
+        from dask.base import tokenize
+
+        assert tokenize(Quantity(1.5, "kcal/mol")) == tokenize(Quantity(1.5, "kilocalorie / mole"))
+        assert tokenize(Quantity(numpy.arange(4.0), "nanometer")) == tokenize(
+            Quantity(numpy.arange(4.0), "nanometer"),
+        )
+
+    def test_unit_order_does_not_matter(self):
+        from dask.base import tokenize
+
+        assert tokenize(Quantity(1.0, "mole / kilocalorie")) == tokenize(
+            Quantity(1.0, "1 / kilocalorie * mole"),
+        )
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            Quantity(2.5, "kilocalorie / mole"),
+            Quantity(1.5, "kilojoule / mole"),
+            Quantity(numpy.array([1.5]), "kilocalorie / mole"),
+            1.5,
+        ],
+    )
+    def test_different_quantities_have_different_tokens(self, other):
+        from dask.base import tokenize
+
+        assert tokenize(Quantity(1.5, "kilocalorie / mole")) != tokenize(other)
+
+    def test_dask_array_magnitude(self):
+        import dask.array
+        from dask.base import tokenize
+
+        array = dask.array.arange(6.0, chunks=3)
+
+        assert tokenize(Quantity(array, "nanometer")) == tokenize(Quantity(array, "nanometer"))
+        assert tokenize(Quantity(array, "nanometer")) != tokenize(Quantity(array + 1, "nanometer"))
+
+    def test_graph_deduplicates_equal_quantities(self):
+        import dask
+
+        first = dask.delayed(Quantity(numpy.arange(3.0), "angstrom"), pure=True)
+        second = dask.delayed(Quantity(numpy.arange(3.0), "angstrom"), pure=True)
+
+        assert first.key == second.key
+
+    @skip_if_missing("uncertainties")
+    def test_measurement(self):
+        from dask.base import tokenize
+
+        measurement = Measurement(1.0, 0.1, "nanometer")
+
+        assert tokenize(measurement) == tokenize(Measurement(1.0, 0.1, "nanometer"))
+        assert tokenize(measurement) != tokenize(Measurement(1.0, 0.2, "nanometer"))
+        assert tokenize(measurement) != tokenize(Measurement(1.0, 0.1, "angstrom"))
+
+
+@skip_if_missing("dask")
+class TestDaskQuantity:
+    @pytest.fixture
+    def values(self):
+        return numpy.random.default_rng(0).uniform(0.0, 10.0, size=(8, 3))
+
+    @pytest.fixture
+    def quantity(self, values):
+        import dask.array
+
+        return Quantity(dask.array.from_array(values, chunks=(2, 3)), "angstrom")
+
+    @staticmethod
+    def n_layers(array) -> int:
+        return len(array.__dask_graph__().layers)
+
+    def test_conversions_are_lazy(self, quantity):
+        import dask.array
+
+        assert isinstance(quantity.to("nanometer").m, dask.array.Array)
+        assert isinstance(quantity.m_as("nanometer"), dask.array.Array)
+        assert isinstance((2 * quantity + quantity).m, dask.array.Array)
+
+    def test_conversion_values(self, quantity, values):
+        numpy.testing.assert_allclose(quantity.to("nanometer").m.compute(), values / 10)
+        numpy.testing.assert_allclose(quantity.m_as("picometer").compute(), values * 100)
+
+    def test_chained_conversions_fuse(self, quantity, values):
+        once = quantity.to("picometer")
+        chained = quantity.to("nanometer").to("micrometer").to("picometer")
+
+        assert self.n_layers(chained.m) == self.n_layers(once.m)
+        assert self.n_layers(quantity.to("nanometer").m_as("picometer")) == self.n_layers(once.m)
+        numpy.testing.assert_allclose(chained.m.compute(), values * 100)
+
+    def test_round_trip_returns_original_array(self, quantity):
+        assert quantity.to("nanometer").to("angstrom").m is quantity.m
+        assert quantity.to("angstrom").m is quantity.m
+
+    def test_ito_fuses(self, quantity, values):
+        original = quantity.m
+
+        quantity.ito("nanometer")
+        quantity.ito("picometer")
+
+        assert quantity.units == unit.picometer
+        assert self.n_layers(quantity.m) == self.n_layers(original) + 1
+        numpy.testing.assert_allclose(quantity.m.compute(), values * 100)
+
+    def test_changed_magnitude_is_not_fused(self, quantity, values):
+        converted = quantity.to("nanometer")
+        converted += Quantity(1.0, "nanometer")
+
+        numpy.testing.assert_allclose(converted.m_as("angstrom").compute(), values + 10)
+
+    def test_offset_units(self):
+        import dask.array
+
+        celsius = Quantity(dask.array.from_array(numpy.array([0.0, 25.0]), chunks=1), "degC")
+
+        numpy.testing.assert_allclose(celsius.m_as("kelvin").compute(), [273.15, 298.15])
+        numpy.testing.assert_allclose(celsius.to("kelvin").to("degC").m.compute(), [0.0, 25.0])
+
+    def test_incompatible_units(self, quantity):
+        from pint.errors import DimensionalityError
+
+        with pytest.raises(DimensionalityError):
+            quantity.to("kilojoule")
+
+    @pytest.mark.parametrize("dtype", [numpy.float32, numpy.float64, numpy.int64])
+    def test_declared_dtype(self, values, dtype):
+        import dask.array
+
+        quantity = Quantity(dask.array.from_array(values.astype(dtype), chunks=(2, 3)), "angstrom")
+        converted = quantity.m_as("nanometer")
+
+        assert converted.dtype == converted.compute().dtype
+
+    def test_compute_returns_openff_quantity(self, quantity, values):
+        computed = quantity.to("nanometer").compute()
+
+        assert isinstance(computed, Quantity)
+        assert isinstance(computed.m, numpy.ndarray)
+        assert computed.units == unit.nanometer
+        numpy.testing.assert_allclose(computed.m, values / 10)
+
+    def test_persist_returns_openff_quantity(self, quantity, values):
+        import dask.array
+
+        persisted = quantity.to("nanometer").persist()
+
+        assert isinstance(persisted, Quantity)
+        assert isinstance(persisted.m, dask.array.Array)
+        numpy.testing.assert_allclose(persisted.to("angstrom").compute().m, values)
+
+    def test_conversion_graphs_deduplicate(self, quantity):
+        assert quantity.to("nanometer").m.name == quantity.to("nanometer").m.name
+
 
 class TestCompChemUnits:
     """Test some non-standard units used in comp chem stacks."""
@@ -115,3 +397,296 @@ class TestNMRUnits:
         assert Quantity("1 watt") == Quantity("1 joule / second")
         assert Quantity("1 henry") == Quantity("1 weber / ampere")
         assert Quantity("1 tesla") == Quantity("1 weber / meter**2")
+
+
+class TestRegistryCache:
+    """Test building the default registry from an on-disk cache."""
+
+    @pytest.fixture
+    def cache_folder(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPENFF_UNITS_CACHE_FOLDER", str(tmp_path))
+
+        return tmp_path
+
+    def test_cache_disabled_by_default(self, monkeypatch):
+        from openff.units.utilities import get_cache_folder
+
+        monkeypatch.delenv("OPENFF_UNITS_CACHE_FOLDER", raising=False)
+
+        assert get_cache_folder() is None
+        assert _build_default_registry().cache_folder is None
+
+    def test_cache_is_written(self, cache_folder):
+        registry = _build_default_registry()
+
+        assert registry.cache_folder == cache_folder
+        assert len([*cache_folder.glob("*.pickle")]) > 0
+
+    def test_cached_registry_matches_uncached(self, cache_folder, monkeypatch):
+        # the first build populates the cache, the second reads from it
+        _build_default_registry()
+        cached = _build_default_registry()
+
+        monkeypatch.delenv("OPENFF_UNITS_CACHE_FOLDER")
+        uncached = _build_default_registry()
+
+        assert cached.cache_folder is not None
+        assert uncached.cache_folder is None
+
+        # prefixed units are added to ``_units`` lazily, so only compare what each name resolves to
+        assert cached._prefixes.keys() == uncached._prefixes.keys()
+
+        for name in uncached._units:
+            assert (name in cached) == (name in uncached)
+
+            if name not in uncached:
+                continue
+
+            cached_factor, cached_units = cached.get_base_units(name, check_nonmult=False)
+            uncached_factor, uncached_units = uncached.get_base_units(name, check_nonmult=False)
+
+            assert cached_factor == pytest.approx(uncached_factor)
+            assert cached_units._units == uncached_units._units
+            assert cached.get_dimensionality(name) == uncached.get_dimensionality(name)
+
+    def test_corrupt_cache_falls_back(self, cache_folder):
+        _build_default_registry()
+
+        for path in cache_folder.glob("*.pickle"):
+            path.write_bytes(b"not a pickle")
+
+        with pytest.warns(UserWarning, match="Failed to use unit registry cache"):
+            registry = _build_default_registry()
+
+        assert registry.Quantity(1.0, "nanometer").m_as("angstrom") == pytest.approx(10.0)
+
+
+class TestParseCache:
+    @pytest.fixture
+    def registry(self):
+        from openff.units.units import UnitRegistry
+        from openff.units.utilities import get_defaults_path
+
+        return UnitRegistry(get_defaults_path(), parse_cache_size=2)
+
+    def test_hits_and_misses(self, registry):
+        registry.clear_parse_cache()
+
+        first = registry.Unit("kilocalorie / mole")
+        second = registry.Unit("kilocalorie / mole")
+        registry.Quantity(1.0, "kilocalorie / mole")
+
+        assert first == second
+
+        cache_info = registry.parse_cache_info()
+
+        assert cache_info.hits == 2
+        assert cache_info.misses == 1
+        assert cache_info.currsize == 1
+        assert cache_info.maxsize == 2
+
+    def test_expressions_are_not_shared(self, registry):
+        first = registry.Quantity("1.5 angstrom")
+        second = registry.Quantity("1.5 angstrom")
+        third = registry.parse_expression("1.5 angstrom")
+
+        assert registry.parse_cache_info().hits == 2
+
+        third.ito("nanometer")
+
+        assert first == second == registry.Quantity(1.5, "angstrom")
+        assert first is not second
+        assert str(registry.parse_expression("1.5 angstrom").units) == "angstrom"
+
+    def test_invalid_expressions_are_cached(self, registry):
+        from pint.errors import UndefinedUnitError
+
+        registry.clear_parse_cache()
+
+        for _ in range(3):
+            assert registry._parse_expression_or_none("Electrostatics") is None
+
+        assert registry.parse_cache_info().hits == 2
+
+        with pytest.raises(UndefinedUnitError):
+            registry.parse_expression("Electrostatics")
+
+    def test_define_forgets_invalid_expressions(self, registry):
+        assert registry._parse_expression_or_none("2 * smoot") is None
+
+        registry.define("smoot = 1.7018 * meter")
+
+        assert registry._parse_expression_or_none("2 * smoot") == registry.Quantity(2, "smoot")
+
+    def test_eviction(self, registry):
+        registry.clear_parse_cache()
+
+        for unit_string in ["meter", "second", "kelvin", "meter"]:
+            registry.Unit(unit_string)
+
+        cache_info = registry.parse_cache_info()
+
+        assert cache_info.misses == 4
+        assert cache_info.evictions == 2
+        assert cache_info.currsize == 2
+
+    def test_least_recently_used_is_evicted(self, registry):
+        registry.clear_parse_cache()
+
+        registry.Unit("meter")
+        registry.Unit("second")
+        registry.Unit("meter")
+        registry.Unit("kelvin")
+
+        # "second" was evicted, "meter" was kept
+        registry.Unit("meter")
+
+        assert registry.parse_cache_info().hits == 2
+
+        registry.Unit("second")
+
+        assert registry.parse_cache_info().misses == 4
+
+    def test_disable(self, registry):
+        registry.set_parse_cache_size(0)
+
+        registry.Unit("meter")
+        registry.Unit("meter")
+
+        cache_info = registry.parse_cache_info()
+
+        assert cache_info.hits == 0
+        assert cache_info.currsize == 0
+
+        with pytest.raises(ValueError, match="non-negative"):
+            registry.set_parse_cache_size(-1)
+
+    def test_define_clears_cache(self, registry):
+        registry.Unit("meter")
+
+        registry.define("smoot = 1.7018 * meter")
+
+        assert registry.parse_cache_info().currsize == 0
+        assert registry.Quantity(1.0, "smoot").m_as("meter") == pytest.approx(1.7018)
+
+    def test_default_registry_caches(self):
+        Unit("kilocalorie / mole / angstrom ** 2")
+        hits = unit.parse_cache_info().hits
+
+        Quantity(1.0, "kilocalorie / mole / angstrom ** 2")
+
+        assert unit.parse_cache_info().hits == hits + 1
+
+
+class TestThreadSafety:
+    @pytest.fixture
+    def registry(self):
+        from openff.units.units import UnitRegistry
+        from openff.units.utilities import get_defaults_path
+
+        return UnitRegistry(get_defaults_path(), parse_cache_size=4)
+
+    @pytest.fixture(autouse=True)
+    def frequent_switching(self):
+        """Switch threads as often as possible, to make races more likely."""
+        import sys
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        yield
+
+        sys.setswitchinterval(interval)
+
+    def test_concurrent_parsing_and_conversion(self, registry):
+        from concurrent.futures import ThreadPoolExecutor
+
+        units = [
+            "nanometer",
+            "angstrom",
+            "kilocalorie / mole",
+            "kilojoule / mole",
+            "picosecond",
+            "dalton",
+            "elementary_charge",
+            "degree",
+        ]
+        targets = [
+            "angstrom",
+            "nanometer",
+            "kilojoule / mole",
+            "kilocalorie / mole",
+            "femtosecond",
+            "gram",
+            "coulomb",
+            "radian",
+        ]
+        n_iterations = 200
+
+        def work(seed):
+            results = []
+
+            for index in range(n_iterations):
+                position = (index + seed) % len(units)
+                quantity = registry.Quantity(f"{index} * {units[position]}")
+                results.append(quantity.m_as(targets[position]))
+
+            return results
+
+        expected = work(0)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(work, [0] * 8))
+
+        assert all(result == expected for result in results)
+
+        cache_info = registry.parse_cache_info()
+
+        # every lookup was counted, and the cache never grew past its size
+        assert cache_info.hits + cache_info.misses >= 9 * n_iterations
+        assert cache_info.currsize <= 4
+
+    def test_concurrent_cache_access(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from openff.units._cache import LRUCache
+
+        cache = LRUCache(maxsize=2)
+
+        def work(seed):
+            for index in range(2000):
+                key = (index + seed) % 5
+
+                if cache.get(key) is None:
+                    cache.put(key, key)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(8)))
+
+        cache_info = cache.info()
+
+        assert cache_info.hits + cache_info.misses == 8 * 2000
+        assert cache_info.currsize == 2
+
+    def test_freeze(self, registry):
+        from openff.units.exceptions import FrozenRegistryError
+
+        registry.define("@context swap\n    [length] -> [time]: value / (1 meter / second)\n@end")
+        registry.define("smoot = 1.7018 * meter")
+
+        assert not registry.frozen
+
+        registry.freeze()
+
+        assert registry.frozen
+        assert registry.Quantity(1.0, "smoot").m_as("meter") == pytest.approx(1.7018)
+
+        with pytest.raises(FrozenRegistryError, match="define units"):
+            registry.define("furlong_per_smoot = furlong / smoot")
+
+        with pytest.raises(FrozenRegistryError, match="enable contexts"):
+            registry.Quantity(1.0, "meter").to("second", "swap")
+
+        with pytest.raises(FrozenRegistryError, match="enable contexts"):
+            with registry.context("swap"):
+                pass
@@ -0,0 +1,260 @@
+"""
+Convert quantities to and from Apache Arrow tables and Parquet files
+"""
+
+import os
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING
+
+import numpy
+from openff.utilities import requires_package
+
+from openff.units.converters import make_converter
+from openff.units.units import Quantity, Unit, _format_units, _parse_units
+
+if TYPE_CHECKING:
+    import pyarrow
+
+__all__ = [
+    "from_arrow",
+    "iter_parquet",
+    "to_arrow",
+    "write_parquet",
+]
+
+UNIT_METADATA_KEY = b"unit"
+"""Key of the field metadata which stores the units of a column."""
+
+
+def _to_arrow_array(name: str, values: numpy.ndarray) -> "pyarrow.Array":
+    import pyarrow
+
+    if values.ndim == 1:
+        return pyarrow.array(values)
+
+    if values.ndim == 2:
+        return pyarrow.FixedSizeListArray.from_arrays(
+            pyarrow.array(numpy.ascontiguousarray(values).reshape(-1)),
+            values.shape[1],
+        )
+
+    raise ValueError(f"Column {name!r} must be one- or two-dimensional, got shape {values.shape}.")
+
+
+def _to_numpy(column: "pyarrow.Array | pyarrow.ChunkedArray") -> numpy.ndarray:
+    import pyarrow
+
+    if isinstance(column, pyarrow.ChunkedArray):
+        column = column.combine_chunks()
+
+    if pyarrow.types.is_fixed_size_list(column.type):
+        width = column.type.list_size
+        return column.flatten().to_numpy(zero_copy_only=False).reshape(-1, width)
+
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _column_units(field: "pyarrow.Field") -> Unit | None:
+    if not field.metadata or UNIT_METADATA_KEY not in field.metadata:
+        return None
+
+    units = field.metadata[UNIT_METADATA_KEY].decode()
+
+    try:
+        return _parse_units(units)
+    except ValueError as error:
+        raise ValueError(f"Column {field.name!r} has invalid units {units!r}.") from error
+
+
+@requires_package("pyarrow")
+def to_arrow(columns: Mapping[str, Quantity | numpy.ndarray]) -> "pyarrow.Table":
+    """
+    Convert quantities to an Arrow table, with the units of each column in its field metadata.
+
+    Each quantity becomes a column, whose field stores its units as the ``unit`` metadata key.
+    Two-dimensional arrays, like positions, become columns of fixed-size lists. Arrays without
+    units are stored as they are, without metadata.
+
+    Parameters
+    ----------
+    columns
+        The quantities to convert, keyed by column name. All must have the same length.
+
+    Examples
+    --------
+
+    >>> import numpy
+    >>> from openff.units import Quantity
+    >>> from openff.units.arrow import from_arrow, to_arrow
+    >>> table = to_arrow({"charge": Quantity(numpy.array([-0.8, 0.4, 0.4]), "elementary_charge")})
+    >>> table.schema.field("charge").metadata
+    {b'unit': b'elementary_charge'}
+    >>> from_arrow(table)["charge"]
+    <Quantity([-0.8  0.4  0.4], 'elementary_charge')>
+    """
+    import pyarrow
+
+    arrays = []
+    fields = []
+
+    for name, column in columns.items():
+        if isinstance(column, Quantity):
+            values = numpy.asarray(column.m)
+            metadata = {UNIT_METADATA_KEY: _format_units(column._units).encode()}
+        else:
+            values = numpy.asarray(column)
+            metadata = None
+
+        array = _to_arrow_array(name, values)
+
+        arrays.append(array)
+        fields.append(pyarrow.field(name, array.type, metadata=metadata))
+
+    return pyarrow.Table.from_arrays(arrays, schema=pyarrow.schema(fields))
+
+
+@requires_package("pyarrow")
+def from_arrow(
+    table: "pyarrow.Table | pyarrow.RecordBatch",
+    units: Mapping[str, Unit | str] | None = None,
+) -> dict[str, Quantity | numpy.ndarray]:
+    """
+    Convert an Arrow table or record batch to quantities, using the units in its field metadata.
+
+    Columns without units are returned as NumPy arrays.
+
+    Parameters
+    ----------
+    table
+        The table or record batch to convert.
+    units
+        Units to convert columns to, keyed by column name. Other columns keep their stored units.
+
+    Raises
+    ------
+    ValueError
+        If the stored units are not valid in the default unit registry, or units are requested for
+        a column which has none.
+    """
+    return _Reader(table.schema, units).read(table)
+
+
+class _Reader:
+    """Convert tables or batches with a common schema, resolving units and converters once."""
+
+    def __init__(self, schema: "pyarrow.Schema", units: Mapping[str, Unit | str] | None):
+        units = dict(units or {})
+
+        self.units: dict[str, Unit] = dict()
+        self.converters = dict()
+
+        for field in schema:
+            stored = _column_units(field)
+
+            if stored is None:
+                if field.name in units:
+                    raise ValueError(f"Cannot convert column {field.name!r}, which has no units.")
+                continue
+
+            target = Unit(units.pop(field.name, stored))
+
+            self.units[field.name] = target
+
+            if target != stored:
+                self.converters[field.name] = make_converter(stored, target)
+
+        if units:
+            raise ValueError(f"Cannot convert columns {sorted(units)}, which were not found.")
+
+    def read(self, table: "pyarrow.Table | pyarrow.RecordBatch") -> dict:
+        columns: dict[str, Quantity | numpy.ndarray] = dict()
+
+        for name, column in zip(table.column_names, table.columns):
+            values = _to_numpy(column)
+
+            if name not in self.units:
+                columns[name] = values
+                continue
+
+            if name in self.converters:
+                values = self.converters[name](values)
+
+            columns[name] = Quantity.from_magnitude(values, self.units[name])
+
+        return columns
+
+
+@requires_package("pyarrow")
+def write_parquet(
+    path: str | os.PathLike,
+    columns: Mapping[str, Quantity | numpy.ndarray],
+    **kwargs,
+):
+    """
+    Write quantities to a Parquet file, with the units of each column in its field metadata.
+
+    See :func:`to_arrow` for how quantities are stored. Keyword arguments are passed to
+    :func:`pyarrow.parquet.write_table`; for example, ``row_group_size`` sets the number of rows
+    read into memory at once by readers of the file.
+    """
+    import pyarrow.parquet
+
+    pyarrow.parquet.write_table(to_arrow(columns), path, **kwargs)
+
+
+@requires_package("pyarrow")
+def iter_parquet(
+    path: str | os.PathLike,
+    columns: list[str] | None = None,
+    units: Mapping[str, Unit | str] | None = None,
+    batch_size: int = 65_536,
+) -> Iterator[dict[str, Quantity | numpy.ndarray]]:
+    """
+    Stream a Parquet file as batches of quantities, without reading the whole file into memory.
+
+    Units are read from the field metadata once, and the conversion to the requested units is
+    resolved once and then applied to each batch.
+
+    Parameters
+    ----------
+    path
+        The path to the Parquet file.
+    columns
+        The columns to read. By default, all columns are read.
+    units
+        Units to convert columns to, keyed by column name. Other columns keep their stored units.
+    batch_size
+        The maximum number of rows in each batch.
+
+    Yields
+    ------
+    A dictionary of quantities, or NumPy arrays for columns without units, keyed by column name.
+
+    Examples
+    --------
+
+    >>> import pathlib
+    >>> import tempfile
+    >>> import numpy
+    >>> from openff.units import Quantity
+    >>> from openff.units.arrow import iter_parquet, write_parquet
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = pathlib.Path(directory, "energies.parquet")
+    ...     write_parquet(path, {"energy": Quantity(numpy.arange(5.0), "kilocalorie / mole")})
+    ...     for batch in iter_parquet(path, units={"energy": "kilojoule / mole"}, batch_size=3):
+    ...         print(batch["energy"])
+    [0.0 4.184 8.368] kilojoule / mole
+    [12.552 16.736] kilojoule / mole
+    """
+    import pyarrow.parquet
+
+    with pyarrow.parquet.ParquetFile(path) as parquet_file:
+        schema = parquet_file.schema_arrow
+
+        if columns is not None:
+            schema = pyarrow.schema([schema.field(name) for name in columns])
+
+        reader = _Reader(schema, units)
+
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            yield reader.read(batch)
@@ -0,0 +1,121 @@
+"""
+Precomputed conversions between pairs of units
+"""
+
+import functools
+
+import numpy
+
+from openff.units.units import Quantity, Unit
+
+__all__ = [
+    "UnitConverter",
+    "make_converter",
+]
+
+
+class UnitConverter:
+    """
+    Convert raw magnitudes from one unit to another with a precomputed transform.
+
+    Converters are created with :func:`make_converter`, which resolves the source and target units
+    once. Calling a converter then computes ``values * scale + offset``, where ``offset`` is zero
+    unless either unit has an offset (like ``degree_Celsius``).
+    """
+
+    __slots__ = ("dst", "offset", "scale", "src")
+
+    def __init__(self, src: Unit, dst: Unit, scale: float, offset: float = 0.0):
+        self.src = src
+        self.dst = dst
+        self.scale = scale
+        self.offset = offset
+
+    def __dask_tokenize__(self):
+        return ("openff.units.UnitConverter", self.scale, self.offset)
+
+    def __repr__(self) -> str:
+        return f"UnitConverter(src={str(self.src)!r}, dst={str(self.dst)!r})"
+
+    def __call__(self, values, out: numpy.ndarray | None = None):
+        """
+        Convert magnitudes in the source units to magnitudes in the target units.
+
+        Parameters
+        ----------
+        values
+            A number or array of magnitudes in the source units. Must not be a ``Quantity``.
+        out
+            An optional array to write the result into, which may be ``values`` itself to convert
+            in place. Its shape must match ``values`` and its dtype must be able to hold floats.
+
+        Returns
+        -------
+        A number or array of magnitudes in the target units. If ``out`` is given, it is returned.
+        """
+        if isinstance(values, Quantity):
+            raise TypeError(
+                "Unit converters operate on magnitudes, not quantities. Use `Quantity.m_as` or "
+                f"pass the magnitude in units of {self.src}."
+            )
+
+        result = numpy.multiply(values, self.scale, out=out)
+
+        if self.offset != 0.0:
+            if isinstance(result, numpy.ndarray):
+                numpy.add(result, self.offset, out=result)
+            else:
+                result = result + self.offset
+
+        return result
+
+
+def make_converter(src: Unit | str, dst: Unit | str) -> UnitConverter:
+    """
+    Build a callable which converts magnitudes from ``src`` units to ``dst`` units.
+
+    Converting a quantity with ``.to()`` or ``.m_as()`` repeats the dimensional analysis and the
+    computation of the conversion factor every time, and allocates a new array for the result. A
+    converter does that work once, which makes it suited to converting many arrays in a loop, such
+    as the frames of a trajectory. Pass ``out=`` to avoid allocating a new array on each call.
+
+    Converters are cached, so calling this function repeatedly with the same units is cheap.
+
+    Parameters
+    ----------
+    src
+        The units of the magnitudes that will be passed to the converter.
+    dst
+        The units of the magnitudes that the converter will return.
+
+    Raises
+    ------
+    pint.errors.DimensionalityError
+        If ``src`` and ``dst`` have different dimensions.
+
+    Examples
+    --------
+
+    >>> import numpy
+    >>> from openff.units.converters import make_converter
+    >>> to_nanometer = make_converter("angstrom", "nanometer")
+    >>> frame = numpy.array([[10.0, 20.0, 30.0]])
+    >>> to_nanometer(frame, out=frame)
+    array([[1., 2., 3.]])
+    >>> make_converter("degree_Celsius", "kelvin")(numpy.array([0.0, 25.0]))
+    array([273.15, 298.15])
+    """
+    return _make_converter(Unit(src), Unit(dst))
+
+
+@functools.lru_cache(maxsize=256)
+def _make_converter(src: Unit, dst: Unit) -> UnitConverter:
+    registry = src._REGISTRY
+
+    # Converting zero checks the dimensions, and gives the offset of the transform.
+    # Offsets do not change the scale, so it is the ratio of the units' root factors, which is also
+    # what Pint itself uses to convert multiplicative units.
+    offset = float(registry.convert(0.0, src, dst))
+    scale = float(registry.get_root_units(src / dst)[0])
+
+    return UnitConverter(src, dst, scale, offset)
@@ -1,7 +1,8 @@
 """
 Symbols and masses for the chemical elements.
 
-This module provides mappings from atomic number to atomic mass and symbol.
+This module provides mappings from atomic number to atomic mass and symbol, as well as
+read-only NumPy arrays indexed by atomic number and functions for looking up many atoms at once.
 These dicts were seeded from running the below script using OpenMM 7.7.
 
 It's not completely clear where OpenMM sourced these values from [1] but they are generally
@@ -28,139 +29,155 @@ consistent with recent IUPAC values [2].
 
 """
 
-from openff.units import Quantity, unit
+import functools
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy
+    from numpy.typing import ArrayLike
+
+    from openff.units import Quantity
 
 __all__ = [
     "MASSES",
+    "MASS_TABLE",
     "NUMBERS",
     "SYMBOLS",
+    "SYMBOL_TABLE",
+    "element_counts",
+    "masses_of",
+    "molecular_masses",
+    "numbers_of",
 ]
 
-"""Mapping from atomic number to atomic mass"""
-MASSES: dict[int, Quantity] = {
-    # https://github.com/hgrecco/pint/issues/1804
-    index + 1: Quantity(mass, unit.dalton)
-    for index, mass in enumerate(
-        [
-            1.007947,
-            4.003,
-            6.9412,
-            9.0121823,
-            10.8117,
-            12.01078,
-            14.00672,
-            15.99943,
-            18.99840325,
-            20.17976,
-            22.989769282,
-            24.30506,
-            26.98153868,
-            28.08553,
-            30.9737622,
-            32.0655,
-            35.4532,
-            39.9481,
-            39.09831,
-            40.0784,
-            44.9559126,
-            47.8671,
-            50.94151,
-            51.99616,
-            54.9380455,
-            55.8452,
-            58.9331955,
-            58.69342,
-            63.5463,
-            65.4094,
-            69.7231,
-            72.641,
-            74.921602,
-            78.963,
-            79.9041,
-            83.7982,
-            85.46783,
-            87.621,
-            88.905852,
-            91.2242,
-            92.906382,
-            95.942,
-            98,
-            101.072,
-            102.905502,
-            106.421,
-            107.86822,
-            112.4118,
-            114.8183,
-            118.7107,
-            121.7601,
-            127.603,
-            126.904473,
-            131.2936,
-            132.90545192,
-            137.3277,
-            138.905477,
-            140.1161,
-            140.907652,
-            144.2423,
-            145,
-            150.362,
-            151.9641,
-            157.253,
-            158.925352,
-            162.5001,
-            164.930322,
-            167.2593,
-            168.934212,
-            173.043,
-            174.9671,
-            178.492,
-            180.947882,
-            183.841,
-            186.2071,
-            190.233,
-            192.2173,
-            195.0849,
-            196.9665694,
-            200.592,
-            204.38332,
-            207.21,
-            208.980401,
-            209,
-            210,
-            222.018,
-            223,
-            226,
-            227,
-            232.038062,
-            231.035882,
-            238.028913,
-            237,
-            244,
-            243,
-            247,
-            247,
-            251,
-            252,
-            257,
-            258,
-            259,
-            262,
-            261,
-            262,
-            266,
-            264,
-            269,
-            268,
-            281,
-            272,
-            285,
-            284,
-            289,
-            288,
-            292,
-        ]
-    )
-}
+# Atomic masses in daltons, indexed by atomic number minus one. ``MASSES`` is built from these
+# on first access so that importing this module does not require building the unit registry.
+_MASS_VALUES: tuple[float, ...] = (
+    1.007947,
+    4.003,
+    6.9412,
+    9.0121823,
+    10.8117,
+    12.01078,
+    14.00672,
+    15.99943,
+    18.99840325,
+    20.17976,
+    22.989769282,
+    24.30506,
+    26.98153868,
+    28.08553,
+    30.9737622,
+    32.0655,
+    35.4532,
+    39.9481,
+    39.09831,
+    40.0784,
+    44.9559126,
+    47.8671,
+    50.94151,
+    51.99616,
+    54.9380455,
+    55.8452,
+    58.9331955,
+    58.69342,
+    63.5463,
+    65.4094,
+    69.7231,
+    72.641,
+    74.921602,
+    78.963,
+    79.9041,
+    83.7982,
+    85.46783,
+    87.621,
+    88.905852,
+    91.2242,
+    92.906382,
+    95.942,
+    98,
+    101.072,
+    102.905502,
+    106.421,
+    107.86822,
+    112.4118,
+    114.8183,
+    118.7107,
+    121.7601,
+    127.603,
+    126.904473,
+    131.2936,
+    132.90545192,
+    137.3277,
+    138.905477,
+    140.1161,
+    140.907652,
+    144.2423,
+    145,
+    150.362,
+    151.9641,
+    157.253,
+    158.925352,
+    162.5001,
+    164.930322,
+    167.2593,
+    168.934212,
+    173.043,
+    174.9671,
+    178.492,
+    180.947882,
+    183.841,
+    186.2071,
+    190.233,
+    192.2173,
+    195.0849,
+    196.9665694,
+    200.592,
+    204.38332,
+    207.21,
+    208.980401,
+    209,
+    210,
+    222.018,
+    223,
+    226,
+    227,
+    232.038062,
+    231.035882,
+    238.028913,
+    237,
+    244,
+    243,
+    247,
+    247,
+    251,
+    252,
+    257,
+    258,
+    259,
+    262,
+    261,
+    262,
+    266,
+    264,
+    269,
+    268,
+    281,
+    272,
+    285,
+    284,
+    289,
+    288,
+    292,
+)
+
+if TYPE_CHECKING:
+    # Mapping from atomic number to atomic mass, built on first access by ``__getattr__``
+    MASSES: dict[int, Quantity]
+    # Read-only arrays indexed by atomic number, built on first access by ``__getattr__``
+    MASS_TABLE: numpy.ndarray
+    SYMBOL_TABLE: numpy.ndarray
 
 """Mapping from atomic number to element symbol"""
 SYMBOLS: dict[int, str] = {
@@ -289,3 +306,351 @@ SYMBOLS: dict[int, str] = {
 
 """Mapping from element symbol to atomic number"""
 NUMBERS: dict[str, int] = {val: key for key, val in SYMBOLS.items()}
+
+
+@functools.cache
+def _mass_table() -> "numpy.ndarray":
+    """Build a read-only array of masses in daltons indexed by atomic number, with NaN at 0."""
+    import numpy
+
+    table = numpy.array([numpy.nan, *_MASS_VALUES], dtype=numpy.float64)
+    table.flags.writeable = False
+
+    return table
+
+
+@functools.cache
+def _symbol_table() -> "numpy.ndarray":
+    """Build a read-only array of element symbols indexed by atomic number, with "" at 0."""
+    import numpy
+
+    table = numpy.array(["", *SYMBOLS.values()])
+    table.flags.writeable = False
+
+    return table
+
+
+def _check_atomic_numbers(atomic_numbers: "ArrayLike") -> "numpy.ndarray":
+    """Convert atomic numbers to an integer array, raising if any are not known elements."""
+    import numpy
+
+    atomic_numbers = numpy.asarray(atomic_numbers)
+
+    if atomic_numbers.size == 0:
+        return atomic_numbers.astype(numpy.intp)
+
+    if not numpy.issubdtype(atomic_numbers.dtype, numpy.integer):
+        raise TypeError(f"Expected integer atomic numbers, got dtype {atomic_numbers.dtype}.")
+
+    if atomic_numbers.min() < 1 or atomic_numbers.max() > len(_MASS_VALUES):
+        invalid = numpy.unique(
+            atomic_numbers[(atomic_numbers < 1) | (atomic_numbers > len(_MASS_VALUES))]
+        )
+        raise ValueError(f"Unknown atomic numbers {invalid.tolist()}.")
+
+    return atomic_numbers
+
+
+def masses_of(atomic_numbers: "ArrayLike") -> "Quantity":
+    """
+    Look up the masses of many atoms at once.
+
+    Parameters
+    ----------
+    atomic_numbers
+        An integer array, or anything that can be converted to one, of atomic numbers.
+
+    Returns
+    -------
+    masses
+        A quantity wrapping a float64 array of masses in daltons, with the same shape as
+        ``atomic_numbers``.
+
+    Raises
+    ------
+    ValueError
+        If any atomic numbers do not correspond to a known element.
+
+    Examples
+    --------
+
+    >>> from openff.units.elements import masses_of
+    >>> masses_of([8, 1, 1])
+    <Quantity([15.99943   1.007947  1.007947], 'dalton')>
+
+    """
+    from openff.units import Quantity, unit
+
+    return Quantity(_mass_table()[_check_atomic_numbers(atomic_numbers)], unit.dalton)
+
+
+def _check_offsets(offsets: "ArrayLike", n_atoms: int) -> "numpy.ndarray":
+    """Convert CSR-style molecule offsets to an integer array, raising if they are malformed."""
+    import numpy
+
+    offsets = numpy.asarray(offsets)
+
+    if offsets.ndim != 1 or len(offsets) == 0:
+        raise ValueError("Expected a 1-D array of offsets with at least one entry.")
+
+    if not numpy.issubdtype(offsets.dtype, numpy.integer):
+        raise TypeError(f"Expected integer offsets, got dtype {offsets.dtype}.")
+
+    if offsets[0] != 0 or offsets[-1] != n_atoms or (numpy.diff(offsets) < 0).any():
+        raise ValueError(
+            f"Expected non-decreasing offsets starting at 0 and ending at {n_atoms}, the number "
+            "of atoms."
+        )
+
+    return offsets
+
+
+def molecular_masses(atomic_numbers: "ArrayLike", offsets: "ArrayLike") -> "Quantity":
+    """
+    Compute the masses of many molecules at once.
+
+    Atoms of all molecules are stored in one flat array, in the same layout as the indices of
+    a compressed sparse row (CSR) matrix: the atoms of molecule ``i`` are
+    ``atomic_numbers[offsets[i]:offsets[i + 1]]``.
+
+    Parameters
+    ----------
+    atomic_numbers
+        A 1-D integer array of the atomic numbers of every atom in every molecule.
+    offsets
+        A 1-D integer array, with one more entry than there are molecules, of the index of the
+        first atom of each molecule followed by the total number of atoms.
+
+    Returns
+    -------
+    masses
+        A quantity wrapping a float64 array of the mass of each molecule in daltons.
+        Molecules without atoms have zero mass.
+
+    Examples
+    --------
+
+    >>> from openff.units.elements import molecular_masses
+    >>> # water, methane, and a chloride ion
+    >>> molecular_masses([8, 1, 1, 6, 1, 1, 1, 1, 17], [0, 3, 8, 9])
+    <Quantity([18.015324 16.042568 35.4532  ], 'dalton')>
+
+    """
+    import numpy
+
+    from openff.units import Quantity, unit
+
+    masses = _mass_table()[_check_atomic_numbers(atomic_numbers).reshape(-1)]
+    offsets = _check_offsets(offsets, len(masses))
+
+    molecule_masses = numpy.zeros(len(offsets) - 1, dtype=numpy.float64)
+    non_empty = offsets[:-1] < offsets[1:]
+
+    if non_empty.any():
+        # consecutive non-empty molecules are contiguous, so reducing from their starts alone
+        # sums each one. Empty molecules are left as zero
+        molecule_masses[non_empty] = numpy.add.reduceat(masses, offsets[:-1][non_empty])
+
+    return Quantity(molecule_masses, unit.dalton)
+
+
+def element_counts(
+    atomic_numbers: "ArrayLike",
+    offsets: "ArrayLike",
+) -> tuple["numpy.ndarray", "numpy.ndarray"]:
+    """
+    Count the atoms of each element in many molecules at once, i.e. their empirical formulas.
+
+    Molecules are described in the same layout as :func:`molecular_masses`.
+
+    Parameters
+    ----------
+    atomic_numbers
+        A 1-D integer array of the atomic numbers of every atom in every molecule.
+    offsets
+        A 1-D integer array, with one more entry than there are molecules, of the index of the
+        first atom of each molecule followed by the total number of atoms.
+
+    Returns
+    -------
+    elements
+        A sorted integer array of the atomic numbers present in any molecule.
+    counts
+        An integer array with one row per molecule and one column per entry in ``elements``.
+
+    Examples
+    --------
+
+    >>> from openff.units.elements import element_counts
+    >>> # water, methane, and a chloride ion
+    >>> elements, counts = element_counts([8, 1, 1, 6, 1, 1, 1, 1, 17], [0, 3, 8, 9])
+    >>> elements
+    array([ 1,  6,  8, 17])
+    >>> counts
+    array([[2, 0, 1, 0],
+           [4, 1, 0, 0],
+           [0, 0, 0, 1]])
+
+    """
+    import numpy
+
+    atomic_numbers = _check_atomic_numbers(atomic_numbers).reshape(-1)
+    offsets = _check_offsets(offsets, len(atomic_numbers))
+
+    n_molecules = len(offsets) - 1
+
+    # there are few elements, so counting is cheaper than sorting to find those present
+    elements = numpy.flatnonzero(numpy.bincount(atomic_numbers, minlength=len(_MASS_VALUES) + 1))
+
+    columns = numpy.zeros(len(_MASS_VALUES) + 1, dtype=numpy.intp)
+    columns[elements] = numpy.arange(len(elements))
+
+    molecules = numpy.repeat(numpy.arange(n_molecules), numpy.diff(offsets))
+
+    counts = numpy.bincount(
+        molecules * len(elements) + columns[atomic_numbers],
+        minlength=n_molecules * len(elements),
+    ).reshape(n_molecules, len(elements))
+
+    return elements, counts
+
+
+# Symbols are at most this many characters long
+_MAX_SYMBOL_LENGTH = 3
+
+
+def _symbol_keys(symbols: "numpy.ndarray", case_sensitive: bool = True) -> "numpy.ndarray":
+    """
+    Pack each string in a flat ``str_`` array into one integer, or -1 if it is too long to be a
+    symbol. Comparing integers is much faster than hashing or sorting many short strings.
+    """
+    import numpy
+
+    width = symbols.dtype.itemsize // 4
+
+    # each character of a ``str_`` array is a UCS4 code point
+    code_points = numpy.ascontiguousarray(symbols).view(numpy.uint32).reshape(-1, width)
+
+    if not case_sensitive:
+        code_points = numpy.where(
+            (code_points >= ord("A")) & (code_points <= ord("Z")),
+            code_points + (ord("a") - ord("A")),
+            code_points,
+        )
+
+    # code points need at most 21 bits, so three fit into one 64-bit integer
+    keys = numpy.zeros(len(symbols), dtype=numpy.int64)
+
+    for position in range(min(width, _MAX_SYMBOL_LENGTH)):
+        keys |= code_points[:, position].astype(numpy.int64) << (21 * position)
+
+    if width > _MAX_SYMBOL_LENGTH:
+        keys[code_points[:, _MAX_SYMBOL_LENGTH:].any(axis=1)] = -1
+
+    return keys
+
+
+@functools.cache
+def _symbol_key_table(case_sensitive: bool) -> tuple["numpy.ndarray", "numpy.ndarray"]:
+    """Build sorted symbol keys and the matching atomic numbers for ``numbers_of``."""
+    import numpy
+
+    keys = _symbol_keys(numpy.array([*NUMBERS.keys()]), case_sensitive)
+    numbers = numpy.array([*NUMBERS.values()], dtype=numpy.intp)
+
+    order = numpy.argsort(keys)
+
+    return keys[order], numbers[order]
+
+
+def numbers_of(symbols: "ArrayLike", case_sensitive: bool = True) -> "numpy.ndarray":
+    """
+    Look up the atomic numbers of many element symbols at once.
+
+    Parameters
+    ----------
+    symbols
+        A single string, an array of strings, i.e. with a ``str_``, ``bytes_``, or ``object``
+        dtype, or any iterable of strings.
+    case_sensitive
+        Whether symbols must match the case of ``SYMBOLS``, i.e. ``"Cl"`` but not ``"CL"``.
+
+    Returns
+    -------
+    atomic_numbers
+        An integer array of atomic numbers with the same shape as ``symbols``.
+
+    Raises
+    ------
+    openff.units.exceptions.UnknownElementSymbolError
+        If any symbols do not correspond to a known element. The flat indices and values of all
+        unknown symbols are stored on the exception.
+
+    Examples
+    --------
+
+    >>> from openff.units.elements import numbers_of
+    >>> numbers_of(["C", "H", "Cl"])
+    array([ 6,  1, 17])
+    >>> numbers_of(["CA", "cl"], case_sensitive=False)
+    array([20, 17])
+
+    """
+    import numpy
+
+    from openff.units.exceptions import UnknownElementSymbolError
+
+    # single symbols are iterable, but are passed to NumPy as they are to give a 0-d result
+    if isinstance(symbols, Iterable) and not isinstance(
+        symbols, numpy.ndarray | list | tuple | str | bytes
+    ):
+        symbols = [*symbols]
+
+    symbols = numpy.asarray(symbols)
+
+    if symbols.size == 0:
+        return numpy.zeros(symbols.shape, dtype=numpy.intp)
+
+    if symbols.dtype.kind in "OS":
+        symbols = symbols.astype(str)
+    elif symbols.dtype.kind != "U":
+        raise TypeError(f"Expected element symbols as strings, got dtype {symbols.dtype}.")
+
+    flat_symbols = symbols.reshape(-1)
+
+    keys = _symbol_keys(flat_symbols, case_sensitive)
+    known_keys, known_numbers = _symbol_key_table(case_sensitive)
+
+    positions = numpy.searchsorted(known_keys, keys).clip(max=len(known_keys) - 1)
+    found = known_keys[positions] == keys
+
+    if not found.all():
+        indices = numpy.flatnonzero(~found)
+
+        raise UnknownElementSymbolError(indices, flat_symbols[indices])
+
+    return known_numbers[positions].reshape(symbols.shape)
+
+
+def __getattr__(name: str):
+    """Lazily build ``MASSES`` and array-backed tables, which require Pint or NumPy."""
+    if name == "MASS_TABLE":
+        return _mass_table()
+
+    if name == "SYMBOL_TABLE":
+        return _symbol_table()
+
+    if name == "MASSES":
+        from openff.units import Quantity, unit
+
+        masses = {
+            # https://github.com/hgrecco/pint/issues/1804
+            index + 1: Quantity(mass, unit.dalton)
+            for index, mass in enumerate(_MASS_VALUES)
+        }
+
+        globals()["MASSES"] = masses
+
+        return masses
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,16 @@
 __all__ = [
+    "FrozenRegistryError",
     "MissingOpenMMUnitError",
     "NoneQuantityError",
     "NoneUnitError",
+    "UnknownElementSymbolError",
 ]
 
 
+class FrozenRegistryError(RuntimeError):
+    """Raised when attempting to define units or enable contexts in a frozen unit registry"""
+
+
 class MissingOpenMMUnitError(Exception):
     """Raised when a unit cannot be converted to an equivalent OpenMM unit"""
 
@@ -15,3 +21,22 @@ class NoneQuantityError(Exception):
 
 class NoneUnitError(Exception):
     """Raised when attempting to convert `None` between unit packages as a unit object"""
+
+
+class UnknownElementSymbolError(ValueError):
+    """Raised when looking up element symbols which do not correspond to any known element
+
+    The flat indices and values of every unknown symbol are stored as the ``indices`` and
+    ``symbols`` attributes.
+    """
+
+    def __init__(self, indices, symbols):
+        self.indices = indices
+        self.symbols = symbols
+
+        unique_symbols = sorted({str(symbol) for symbol in symbols})
+
+        super().__init__(
+            f"Found {len(indices)} unknown element symbols, including {unique_symbols[:10]}, "
+            f"at indices {[int(index) for index in indices[:10]]}."
+        )
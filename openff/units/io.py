@@ -0,0 +1,197 @@
+"""
+Save quantities to and load them from NumPy's ``.npy`` and ``.npz`` files
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy
+
+from openff.units.units import Quantity, Unit, _format_units, _parse_units
+
+__all__ = [
+    "load",
+    "save",
+    "savez",
+    "savez_compressed",
+]
+
+UNITS_SUFFIX = ".units"
+"""Suffix added to the name of a ``.npy`` file to name the file that stores its units."""
+
+NPZ_UNITS_KEY = "__units__"
+"""Name of the array in a ``.npz`` file that stores the units of the other arrays."""
+
+
+def _units_path(path: Path) -> Path:
+    return path.with_name(path.name + UNITS_SUFFIX)
+
+
+def _npy_path(file: str | os.PathLike) -> Path:
+    """Get the path NumPy writes a ``.npy`` file to, which always has the ``.npy`` suffix."""
+    path = Path(file)
+
+    return path if path.suffix == ".npy" else path.with_name(path.name + ".npy")
+
+
+def _read_units(units: str, file: str | os.PathLike) -> Unit:
+    """Parse units read from a file, raising ``ValueError`` naming the file if they are invalid."""
+    try:
+        return _parse_units(units)
+    except ValueError as error:
+        raise ValueError(f"File {os.fspath(file)!r} has invalid units {units!r}.") from error
+
+
+def save(file: str | os.PathLike, quantity: Quantity):
+    """
+    Save a quantity to a ``.npy`` file, with its units in a file alongside it.
+
+    The magnitude is written with :func:`numpy.save`, and the units are written as text to a file
+    with the same name and an added ``.units`` suffix. As with :func:`numpy.save`, ``.npy`` is
+    appended to the file name if it does not already end with it.
+
+    Parameters
+    ----------
+    file
+        The path to save the magnitude to.
+    quantity
+        The quantity to save. Its magnitude must be a number or NumPy array of numbers.
+
+    Examples
+    --------
+
+    >>> import pathlib
+    >>> import tempfile
+    >>> import numpy
+    >>> from openff.units import Quantity
+    >>> from openff.units.io import load, save
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     save(pathlib.Path(directory, "positions.npy"), Quantity(numpy.zeros(3), "nanometer"))
+    ...     print(sorted(path.name for path in pathlib.Path(directory).iterdir()))
+    ...     print(load(pathlib.Path(directory, "positions.npy"), mmap_mode="r"))
+    ['positions.npy', 'positions.npy.units']
+    [0.0 0.0 0.0] nanometer
+    """
+    path = _npy_path(file)
+
+    numpy.save(path, numpy.asarray(quantity.m), allow_pickle=False)
+    _units_path(path).write_text(_format_units(quantity._units), encoding="utf-8")
+
+
+def savez(file: str | os.PathLike, **quantities: Quantity):
+    """
+    Save several quantities to an uncompressed ``.npz`` file, with their units.
+
+    The magnitudes are written with :func:`numpy.savez`, and their units are stored in the same
+    archive as an array named ``__units__``. Load the quantities with :func:`load`.
+
+    Parameters
+    ----------
+    file
+        The path to save the archive to.
+    **quantities
+        The quantities to save, keyed by the names to save them as.
+    """
+    numpy.savez(file, **_npz_arrays(quantities))
+
+
+def savez_compressed(file: str | os.PathLike, **quantities: Quantity):
+    """
+    Save several quantities to a compressed ``.npz`` file, with their units.
+
+    See :func:`savez` for details.
+    """
+    numpy.savez_compressed(file, **_npz_arrays(quantities))
+
+
+def _npz_arrays(quantities: dict[str, Quantity]) -> dict[str, Any]:
+    """
+    Get the arrays to save to a ``.npz`` file, keyed by name.
+
+    Values are typed as ``Any`` because they are passed to ``numpy.savez`` as keyword arguments,
+    which type checkers would otherwise match against its other keyword arguments.
+    """
+    if NPZ_UNITS_KEY in quantities:
+        raise ValueError(f"Cannot save a quantity named {NPZ_UNITS_KEY!r}; the name is reserved.")
+
+    for name, quantity in quantities.items():
+        if not isinstance(quantity, Quantity):
+            raise TypeError(f"Expected a Quantity for {name!r}, got {type(quantity).__name__}.")
+
+    units = {name: _format_units(quantity._units) for name, quantity in quantities.items()}
+
+    return {
+        **{name: numpy.asarray(quantity.m) for name, quantity in quantities.items()},
+        NPZ_UNITS_KEY: numpy.array(json.dumps(units)),
+    }
+
+
+def load(
+    file: str | os.PathLike,
+    mmap_mode: Literal["r+", "r", "w+", "c"] | None = None,
+) -> Quantity | dict[str, Quantity]:
+    """
+    Load quantities saved with :func:`save`, :func:`savez`, or :func:`savez_compressed`.
+
+    Units are read from the ``.units`` file alongside a ``.npy`` file, or from the ``__units__``
+    array in a ``.npz`` file, and are checked against the default unit registry.
+
+    Parameters
+    ----------
+    file
+        The path to a ``.npy`` or ``.npz`` file.
+    mmap_mode
+        If given, memory-map a ``.npy`` file with this mode rather than reading it, as described by
+        :func:`numpy.load`. The data are then only read from disk as they are used, so files larger
+        than memory can be loaded. Arrays in ``.npz`` files cannot be memory-mapped.
+
+    Returns
+    -------
+    A quantity for a ``.npy`` file, or a dictionary of quantities keyed by name for a ``.npz``
+    file.
+
+    Raises
+    ------
+    ValueError
+        If the units are missing or are not valid units of the default unit registry, or if
+        ``mmap_mode`` is given for a ``.npz`` file.
+    """
+    loaded = numpy.load(file, mmap_mode=mmap_mode, allow_pickle=False)
+
+    if isinstance(loaded, numpy.lib.npyio.NpzFile):
+        with loaded:
+            return _load_npz(loaded, file, mmap_mode)
+
+    units_path = _units_path(Path(file))
+
+    try:
+        units = units_path.read_text(encoding="utf-8")
+    except FileNotFoundError as error:
+        raise ValueError(
+            f"No units found for {os.fspath(file)!r}, expected them in {units_path}.",
+        ) from error
+
+    return Quantity.from_magnitude(loaded, _read_units(units.strip(), file))
+
+
+def _load_npz(archive, file: str | os.PathLike, mmap_mode) -> dict[str, Quantity]:
+    if mmap_mode is not None:
+        raise ValueError(f"Cannot memory-map arrays in .npz file {os.fspath(file)!r}.")
+
+    if NPZ_UNITS_KEY not in archive.files:
+        raise ValueError(
+            f"No units found in {os.fspath(file)!r}, expected an array named {NPZ_UNITS_KEY!r}.",
+        )
+
+    units = json.loads(archive[NPZ_UNITS_KEY].item())
+
+    missing = sorted(set(archive.files) - set(units) - {NPZ_UNITS_KEY})
+    if missing:
+        raise ValueError(f"No units found in {os.fspath(file)!r} for arrays {missing}.")
+
+    return {
+        name: Quantity.from_magnitude(archive[name], _read_units(unit_string, file))
+        for name, unit_string in units.items()
+    }
@@ -3,9 +3,13 @@ Functions for converting between OpenFF and OpenMM units
 """
 
 import ast
+import functools
+import itertools
 import operator as op
-from typing import Literal
+from collections.abc import Hashable, Mapping, Sequence
+from typing import TYPE_CHECKING, Literal, overload
 
+import numpy
 from openff.utilities import has_package, requires_package
 
 from openff.units.exceptions import (
@@ -15,12 +19,19 @@ from openff.units.exceptions import (
 )
 from openff.units.units import Quantity, Unit
 
+if TYPE_CHECKING:
+    from pint.util import UnitsContainer
+
 __all__ = [
     "ensure_quantity",
     "from_openmm",
+    "from_openmm_many",
     "openmm_unit_to_string",
+    "positions_from_openmm",
+    "positions_to_openmm",
     "string_to_openmm_unit",
     "to_openmm",
+    "to_openmm_many",
 ]
 
 if has_package("openmm.unit"):
@@ -147,6 +158,34 @@ def string_to_openmm_unit(unit_string: str) -> "openmm.unit.Unit":
     return output_unit
 
 
+@functools.lru_cache(maxsize=1024)
+def _openff_units_to_openmm_unit(units: "UnitsContainer") -> "openmm.unit.Unit | None":
+    """
+    Look up the OpenMM unit equivalent to the units of an OpenFF quantity.
+
+    Results are cached, keyed on ``Quantity._units``, so that converting many quantities with the
+    same units only parses each unit once. Units which are missing from OpenMM are cached as
+    ``None`` so that later lookups do not raise and catch ``MissingOpenMMUnitError`` again. Use
+    ``cache_info()`` to inspect the cache and ``cache_clear()`` to empty it.
+    """
+    try:
+        return string_to_openmm_unit(str(units))
+    except MissingOpenMMUnitError:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _openmm_unit_to_openff_unit(openmm_unit_: "openmm.unit.Unit") -> Unit:
+    """
+    Look up the OpenFF unit equivalent to an OpenMM unit.
+
+    Results are cached, keyed on the OpenMM unit, so that converting many quantities with the same
+    units only serializes and parses each unit once. Use ``cache_info()`` to inspect the cache and
+    ``cache_clear()`` to empty it.
+    """
+    return Unit(openmm_unit_to_string(openmm_unit_))
+
+
 @requires_package("openmm.unit")
 def from_openmm(openmm_quantity: "openmm.unit.Quantity") -> Quantity:
     """Convert an OpenMM ``Quantity`` to an OpenFF ``Quantity``
@@ -155,6 +194,11 @@ def from_openmm(openmm_quantity: "openmm.unit.Quantity") -> Quantity:
     :class:`openff.units.Quantity` from this package both represent a numerical
     value with units.
 
+    If the value of ``openmm_quantity`` is a NumPy array, the result wraps the
+    same array without copying it, so the two quantities share memory. A list of
+    OpenMM quantities is first collected into a single OpenMM quantity, which
+    copies its values.
+
     Examples
     --------
 
@@ -173,12 +217,8 @@ def from_openmm(openmm_quantity: "openmm.unit.Quantity") -> Quantity:
     if isinstance(openmm_quantity, list):
         openmm_quantity = openmm.unit.Quantity(openmm_quantity)
     openmm_unit_ = openmm_quantity.unit
-    openmm_value = openmm_quantity.value_in_unit(openmm_unit_)
 
-    target_unit = openmm_unit_to_string(openmm_unit_)
-    target_unit = Unit(target_unit)
-
-    return Quantity(openmm_value, target_unit)
+    return Quantity(_openmm_value(openmm_quantity), _openmm_unit_to_openff_unit(openmm_unit_))
 
 
 @requires_package("openmm.unit")
@@ -193,6 +233,10 @@ def to_openmm(quantity: Quantity) -> "openmm.unit.Quantity":
     may cause the resulting value to be slightly different to the input due to
     the limited precision of floating point numbers.
 
+    If the magnitude of ``quantity`` is a NumPy array and its unit is available
+    in OpenMM, the result wraps the same array without copying it, so the two
+    quantities share memory. Conversion to base units always makes a copy.
+
     Examples
     --------
 
@@ -208,67 +252,306 @@ def to_openmm(quantity: Quantity) -> "openmm.unit.Quantity":
     if quantity is None:
         raise NoneQuantityError("Input is None, expected an (OpenFF) Quantity object.")
 
-    def to_openmm_inner(quantity) -> "openmm.unit.Quantity":
-        value = quantity.m
+    assert isinstance(quantity, Quantity)
 
-        unit_string = str(quantity.units._units)
-        openmm_unit_ = string_to_openmm_unit(unit_string)
+    openmm_unit_ = _openff_units_to_openmm_unit(quantity._units)
 
-        return value * openmm_unit_
+    if openmm_unit_ is None:
+        # base units are shared between both packages
+        quantity = quantity.to_base_units()
+        openmm_unit_ = _openff_units_to_openmm_unit(quantity._units)
 
-    assert isinstance(quantity, Quantity)
+        if openmm_unit_ is None:
+            raise MissingOpenMMUnitError(str(quantity.units))
 
-    try:
-        return to_openmm_inner(quantity)
-    except MissingOpenMMUnitError:
-        return to_openmm_inner(quantity.to_base_units())
+    return openmm.unit.Quantity(quantity.m, openmm_unit_)
+
+
+@overload
+def from_openmm_many(
+    openmm_quantities: Mapping[Hashable, "openmm.unit.Quantity"],
+) -> dict[Hashable, Quantity]: ...
+
+
+@overload
+def from_openmm_many(openmm_quantities: Sequence["openmm.unit.Quantity"]) -> list[Quantity]: ...
+
+
+@requires_package("openmm.unit")
+def from_openmm_many(openmm_quantities):
+    """Convert many OpenMM ``Quantity`` objects to OpenFF ``Quantity`` objects
+
+    Equivalent to calling :func:`from_openmm` on each item, but each distinct unit is only
+    resolved once. Mappings are converted value-by-value into a ``dict`` with the same keys, and
+    other iterables are converted into a ``list`` in the same order.
+
+    Examples
+    --------
+
+    >>> from openff.units.openmm import from_openmm_many
+    >>> from openmm import unit
+    >>> from_openmm_many([1.0 * unit.angstrom, 2.0 * unit.angstrom, 3.0 * unit.kelvin])
+    [<Quantity(1.0, 'angstrom')>, <Quantity(2.0, 'angstrom')>, <Quantity(3.0, 'kelvin')>]
+    >>> from_openmm_many({"sigma": 3.0 * unit.angstrom})
+    {'sigma': <Quantity(3.0, 'angstrom')>}
+
+    """
+    if isinstance(openmm_quantities, Mapping):
+        return dict(
+            zip(
+                openmm_quantities.keys(),
+                from_openmm_many(openmm_quantities.values()),
+            )
+        )
+
+    openff_units: dict[openmm.unit.Unit, Unit] = dict()
+    converted: list[Quantity] = list()
+
+    for openmm_quantity in openmm_quantities:
+        if not isinstance(openmm_quantity, openmm.unit.Quantity):
+            # let the scalar function handle None, lists, and errors
+            converted.append(from_openmm(openmm_quantity))
+            continue
+
+        openmm_unit_ = openmm_quantity.unit
+
+        if openmm_unit_ not in openff_units:
+            openff_units[openmm_unit_] = _openmm_unit_to_openff_unit(openmm_unit_)
+
+        converted.append(Quantity(_openmm_value(openmm_quantity), openff_units[openmm_unit_]))
+
+    return converted
+
+
+@overload
+def to_openmm_many(
+    quantities: Mapping[Hashable, Quantity],
+) -> dict[Hashable, "openmm.unit.Quantity"]: ...
+
+
+@overload
+def to_openmm_many(quantities: Sequence[Quantity]) -> list["openmm.unit.Quantity"]: ...
+
+
+@requires_package("openmm.unit")
+def to_openmm_many(quantities):
+    """Convert many OpenFF ``Quantity`` objects to OpenMM ``Quantity`` objects
+
+    Equivalent to calling :func:`to_openmm` on each item, but each distinct unit is only
+    resolved once. Mappings are converted value-by-value into a ``dict`` with the same keys, and
+    other iterables are converted into a ``list`` in the same order.
+
+    Examples
+    --------
+
+    >>> from openff.units import Quantity
+    >>> from openff.units.openmm import to_openmm_many
+    >>> to_openmm_many([Quantity(1.0, "angstrom"), Quantity(2.0, "angstrom")])
+    [1.0 A, 2.0 A]
+    >>> to_openmm_many({"epsilon": Quantity(0.1, "kilocalorie / mole")})
+    {'epsilon': 0.1 kcal/mol}
+
+    """
+    if isinstance(quantities, Mapping):
+        return dict(
+            zip(
+                quantities.keys(),
+                to_openmm_many(quantities.values()),
+            )
+        )
+
+    openmm_units: dict[UnitsContainer, openmm.unit.Unit | None] = dict()
+    converted: list[openmm.unit.Quantity] = list()
+
+    for quantity in quantities:
+        if not isinstance(quantity, Quantity):
+            # let the scalar function handle None and errors
+            converted.append(to_openmm(quantity))
+            continue
+
+        if quantity._units not in openmm_units:
+            openmm_units[quantity._units] = _openff_units_to_openmm_unit(quantity._units)
+
+        openmm_unit_ = openmm_units[quantity._units]
+
+        if openmm_unit_ is None:
+            # missing from OpenMM, use the base-unit path in the scalar function
+            converted.append(to_openmm(quantity))
+        else:
+            converted.append(openmm.unit.Quantity(quantity.m, openmm_unit_))
+
+    return converted
+
+
+def _openmm_value(openmm_quantity: "openmm.unit.Quantity"):
+    """Get the value of an OpenMM quantity, with lists of ``openmm.Vec3`` as ``(N, 3)`` arrays."""
+    # ``value_in_unit`` deep-copies the value even when the units are unchanged
+    value = openmm_quantity._value
+
+    if _is_vec3_list(value):
+        return _vec3_list_to_array(value)
+
+    return value
+
+
+def _is_vec3_list(value) -> bool:
+    """Return whether ``value`` is a non-empty list of ``openmm.Vec3``, i.e. OpenMM positions."""
+    return isinstance(value, list) and len(value) > 0 and isinstance(value[0], openmm.Vec3)
+
+
+def _vec3_list_to_array(vectors: list["openmm.Vec3"]) -> numpy.ndarray:
+    """Flatten a list of ``openmm.Vec3`` into a contiguous ``(N, 3)`` float64 array in one pass."""
+    return numpy.fromiter(
+        itertools.chain.from_iterable(vectors),
+        dtype=numpy.float64,
+        count=3 * len(vectors),
+    ).reshape(-1, 3)
 
 
+@requires_package("openmm.unit")
+def positions_from_openmm(openmm_positions: "openmm.unit.Quantity") -> Quantity:
+    """Convert OpenMM positions to an OpenFF ``Quantity`` wrapping an ``(N, 3)`` array
+
+    ``openmm_positions`` may wrap a list of :class:`openmm.Vec3`, as returned by
+    ``State.getPositions()`` or ``PDBFile.getPositions()``, or a NumPy array. The
+    result always wraps a contiguous ``(N, 3)`` array of float64 in the same units,
+    which shares memory with ``openmm_positions`` if it already wraps one.
+
+    Examples
+    --------
+
+    >>> from openmm import Vec3, unit
+    >>> from openff.units.openmm import positions_from_openmm
+    >>> positions = [Vec3(0.0, 0.0, 0.0), Vec3(0.1, 0.0, 0.0)] * unit.nanometer
+    >>> positions_from_openmm(positions)
+    <Quantity([[0.  0.  0. ]
+     [0.1 0.  0. ]], 'nanometer')>
+
+    """
+    if openmm_positions is None:
+        raise NoneQuantityError("Input is None, expected an (OpenMM) Quantity object.")
+
+    if isinstance(openmm_positions, list):
+        openmm_positions = openmm.unit.Quantity(openmm_positions)
+
+    value = openmm_positions._value
+
+    if _is_vec3_list(value):
+        array = _vec3_list_to_array(value)
+    else:
+        array = numpy.ascontiguousarray(value, dtype=numpy.float64)
+
+        if array.size == 0:
+            array = array.reshape(0, 3)
+        elif array.ndim != 2 or array.shape[1] != 3:
+            raise ValueError(f"Expected positions with shape (N, 3), got shape {array.shape}.")
+
+    return Quantity(array, _openmm_unit_to_openff_unit(openmm_positions.unit))
+
+
+@requires_package("openmm.unit")
+def positions_to_openmm(positions: Quantity) -> "openmm.unit.Quantity":
+    """Convert positions to an OpenMM ``Quantity`` in the layout OpenMM consumes fastest
+
+    The result wraps a contiguous ``(N, 3)`` array of float64 in nanometers, which
+    methods like ``Context.setPositions`` read directly without iterating over
+    :class:`openmm.Vec3` objects. No copy is made if ``positions`` already wraps
+    such an array in nanometers.
+
+    Examples
+    --------
+
+    >>> import numpy
+    >>> from openff.units import Quantity
+    >>> from openff.units.openmm import positions_to_openmm
+    >>> positions_to_openmm(Quantity(numpy.zeros((2, 3)), "angstrom"))
+    [[0. 0. 0.]
+     [0. 0. 0.]] nm
+
+    """
+    if positions is None:
+        raise NoneQuantityError("Input is None, expected an (OpenFF) Quantity object.")
+
+    array = numpy.ascontiguousarray(positions.m_as("nanometer"), dtype=numpy.float64)
+
+    if array.ndim != 2 or array.shape[1] != 3:
+        raise ValueError(f"Expected positions with shape (N, 3), got shape {array.shape}.")
+
+    return openmm.unit.Quantity(array, openmm.unit.nanometer)
+
+
+@functools.singledispatch
 @requires_package("openmm.unit")
 def _ensure_openmm_quantity(
     unknown_quantity: EitherQuantity,
 ) -> "openmm.unit.Quantity":
-    if "openmm" in str(type(unknown_quantity)):
-        from openmm import unit as openmm_unit
+    """
+    Coerce an object into an OpenMM ``Quantity``, dispatching on its type.
 
-        if isinstance(unknown_quantity, openmm_unit.Quantity):
-            return unknown_quantity
-        else:
-            raise ValueError(f"Failed to process input of type {type(unknown_quantity)}.")
-    elif isinstance(unknown_quantity, Quantity):
-        return to_openmm(unknown_quantity)
-    else:
-        import openmm.unit
+    This is the fallback for types without a registered handler, which wraps values as
+    dimensionless quantities.
+    """
+    if type(unknown_quantity).__module__.startswith("openmm"):
+        raise ValueError(f"Failed to process input of type {type(unknown_quantity)}.")
+
+    try:
+        return openmm.unit.Quantity(
+            unknown_quantity,
+            openmm.unit.dimensionless,
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to process input of type {type(unknown_quantity)}.") from e
 
-        try:
-            return openmm.unit.Quantity(
-                unknown_quantity,
-                openmm.unit.dimensionless,
-            )
-        except Exception as e:
-            raise ValueError(f"Failed to process input of type {type(unknown_quantity)}.") from e
 
+@_ensure_openmm_quantity.register
+def _(unknown_quantity: Quantity) -> "openmm.unit.Quantity":
+    return to_openmm(unknown_quantity)
 
+
+@functools.singledispatch
 def _ensure_openff_quantity(
     unknown_quantity: EitherQuantity,
 ) -> Quantity:
-    if isinstance(unknown_quantity, Quantity):
+    """
+    Coerce an object into an OpenFF ``Quantity``, dispatching on its type.
+
+    This is the fallback for types without a registered handler, which wraps values as
+    dimensionless quantities.
+    """
+    if type(unknown_quantity).__module__.startswith("openmm"):
+        raise ValueError(f"Failed to process input of type {type(unknown_quantity)}.")
+
+    try:
+        return Quantity(
+            unknown_quantity,
+            _DIMENSIONLESS,
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to process input of type {type(unknown_quantity)}.") from e
+
+
+@_ensure_openff_quantity.register
+def _(unknown_quantity: Quantity) -> Quantity:
+    return unknown_quantity
+
+
+if has_package("openmm.unit"):
+
+    @_ensure_openmm_quantity.register
+    def _(unknown_quantity: openmm.unit.Quantity) -> "openmm.unit.Quantity":
         return unknown_quantity
-    elif "openmm" in str(type(unknown_quantity)):
-        import openmm.unit
 
-        if isinstance(unknown_quantity, openmm.unit.Quantity):
-            return from_openmm(unknown_quantity)
-        else:
-            raise ValueError(f"Failed to process input of type {type(unknown_quantity)}.")
-    else:
-        try:
-            return Quantity(
-                unknown_quantity,
-                "dimensionless",
-            )
-        except Exception as e:
-            raise ValueError(f"Failed to process input of type {type(unknown_quantity)}.") from e
+    @_ensure_openff_quantity.register
+    def _(unknown_quantity: openmm.unit.Quantity) -> Quantity:
+        return from_openmm(unknown_quantity)
+
+
+_DIMENSIONLESS = Unit("dimensionless")
+
+_ENSURE_QUANTITY = {
+    "openmm": _ensure_openmm_quantity,
+    "openff": _ensure_openff_quantity,
+}
 
 
 def ensure_quantity(
@@ -302,12 +585,14 @@ def ensure_quantity(
     4.0 dimensionless
 
     """
-    if type_to_ensure == "openmm":
-        return _ensure_openmm_quantity(unknown_quantity)
-    elif type_to_ensure == "openff":
-        return _ensure_openff_quantity(unknown_quantity)
-    else:
+    try:
+        ensure = _ENSURE_QUANTITY[type_to_ensure]
+    except KeyError:
         raise ValueError(
             f"Unsupported `type_to_ensure` found. Given {type_to_ensure}, expected 'openff' or "
             "'openmm'."
         )
+
+    # ``singledispatch`` caches the handler for each type, and clears its cache when a handler
+    # is registered, so resolve the handler with ``dispatch`` and call it directly
+    return ensure.dispatch(type(unknown_quantity))(unknown_quantity)
@@ -0,0 +1,233 @@
+"""
+Parse quantities from strings, and convert all quantity strings in nested data
+"""
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+import numpy
+
+from openff.units.converters import make_converter
+from openff.units.units import DEFAULT_UNIT_REGISTRY, Quantity, Unit
+
+__all__ = [
+    "convert_all_strings_to_quantity",
+    "string_to_quantity",
+]
+
+# An integer or float literal, as it would be read by Python
+_NUMBER = (
+    r"[+-]?(?:(?:0|[1-9]\d*)(?![\d.eE])"
+    r"|\d+\.\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+)"
+)
+
+# A unit expression which is a product or quotient of powers of units, so that multiplying it by
+# a magnitude does not depend on operator precedence. Minus signs are only allowed in exponents.
+_UNITS = r"(?:[^\W\d]|[°(])(?:[\w\s*/^().°]|(?:\*\*|\^)\s*-)*"
+
+_QUANTITY_STRING = re.compile(
+    rf"\s*(?:(?P<magnitude>{_NUMBER})(?:(?:\s*\*\s*|\s+|(?=[^\W\d_eE]|°))(?P<units>{_UNITS}))?"
+    rf"|(?P<bare_units>{_UNITS}))\s*",
+)
+
+# Characters which cannot appear in a quantity, but which are common in other strings, like SMIRKS
+_NOT_QUANTITY = re.compile(r"[\[\]#:~@$=!?;&|<>{}\"'\\]")
+
+
+def string_to_quantity(string: str) -> str | int | float | Quantity:
+    """
+    Parse a string into a quantity, returning the string unchanged if it is not a quantity.
+
+    Strings like ``"1.5 * angstrom"`` are split into the magnitude and the unit expression, and
+    each distinct unit expression is only parsed once, including those which are not units. Other
+    strings, like SMIRKS patterns or names, are returned without raising an exception.
+    Dimensionless integers and floats are returned as they are, not as quantities. Unlike
+    ``Quantity(string)``, a magnitude may be given with offset units, like ``"25 * degC"``.
+
+    Examples
+    --------
+
+    >>> from openff.units.parsing import string_to_quantity
+    >>> string_to_quantity("1.5 * angstrom")
+    <Quantity(1.5, 'angstrom')>
+    >>> string_to_quantity("0.5")
+    0.5
+    >>> string_to_quantity("[#6X4:1]-[#1:2]")
+    '[#6X4:1]-[#1:2]'
+    >>> string_to_quantity("PME")
+    'PME'
+    """
+    match = _QUANTITY_STRING.fullmatch(string)
+
+    if match is None:
+        if _NOT_QUANTITY.search(string):
+            return string
+        return _parse_quantity(string)
+
+    magnitude, units, bare_units = match.group("magnitude", "units", "bare_units")
+
+    if magnitude is None:
+        units = bare_units
+    elif units is None:
+        return _to_number(magnitude)
+
+    parsed = _parse_unit_expression(units.rstrip())
+
+    if parsed is None:
+        return string
+
+    factor, parsed_units = parsed
+
+    if magnitude is not None:
+        factor = _to_number(magnitude) * factor
+
+    return _to_quantity(factor, parsed_units)
+
+
+def convert_all_strings_to_quantity(data: Any, ignore_keys: Iterable[str] = tuple()) -> Any:
+    """
+    Convert all quantity strings in nested dictionaries and lists with :func:`string_to_quantity`.
+
+    Dictionaries and lists are modified in place and returned. Values of keys in ``ignore_keys``
+    are left as they are, and so are values which are not strings, dictionaries, or lists.
+
+    Examples
+    --------
+
+    >>> from openff.units.parsing import convert_all_strings_to_quantity
+    >>> data = {"version": "0.3", "Bond": [{"smirks": "[#6:1]-[#6:2]", "length": "1.5 * nm"}]}
+    >>> convert_all_strings_to_quantity(data, ignore_keys=["version"])["Bond"]
+    [{'smirks': '[#6:1]-[#6:2]', 'length': <Quantity(1.5, 'nanometer')>}]
+    >>> data["version"]
+    '0.3'
+    """
+    ignore_keys = frozenset(ignore_keys)
+
+    return _convert(data, ignore_keys)
+
+
+def _convert(data: Any, ignore_keys: frozenset[str]) -> Any:
+    if isinstance(data, str):
+        return string_to_quantity(data)
+
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key not in ignore_keys:
+                data[key] = _convert(value, ignore_keys)
+
+    elif isinstance(data, list):
+        for index, item in enumerate(data):
+            data[index] = _convert(item, ignore_keys)
+
+    return data
+
+
+def _parse_strings(strings: Iterable[str], units: Unit | str | None) -> tuple[numpy.ndarray, Unit]:
+    """
+    Parse quantity strings into one array of magnitudes in common units, for
+    :meth:`Quantity.from_strings <openff.units.Quantity.from_strings>`.
+
+    Magnitudes are collected as strings and converted to an array by NumPy. Strings are grouped by
+    their units, and each group is converted to the target units with one array operation.
+    """
+    magnitudes: list[str | float] = []
+    groups: dict[Unit, list[int]] = dict()
+
+    for index, string in enumerate(strings):
+        match = _QUANTITY_STRING.fullmatch(string)
+        parsed = None
+
+        if match is not None and match["magnitude"] is not None and match["units"] is not None:
+            parsed = _parse_unit_expression(match["units"].rstrip())
+
+        magnitude: str | float
+
+        if match is not None and parsed is not None:
+            factor, parsed_units = parsed
+            magnitude = match["magnitude"]
+
+            if factor != 1:
+                magnitude = float(magnitude) * factor
+        else:
+            quantity = string_to_quantity(string)
+
+            if isinstance(quantity, str):
+                raise ValueError(f"Cannot parse {string!r} as a quantity.")
+
+            if isinstance(quantity, Quantity):
+                # strings only parse to scalar quantities
+                magnitude, parsed_units = float(quantity.magnitude), quantity.units
+            else:
+                magnitude, parsed_units = quantity, DEFAULT_UNIT_REGISTRY.dimensionless
+
+        magnitudes.append(magnitude)
+        groups.setdefault(parsed_units, []).append(index)
+
+    if units is not None:
+        target = Unit(units)
+    elif groups:
+        target = next(iter(groups))
+    else:
+        raise ValueError("Units must be given to parse an empty sequence of strings.")
+
+    values = numpy.array(magnitudes, dtype=numpy.float64)
+
+    for source, indices in groups.items():
+        converter = make_converter(source, target)
+
+        if converter.scale == 1.0 and converter.offset == 0.0:
+            continue
+
+        if len(groups) == 1:
+            converter(values, out=values)
+        else:
+            values[indices] = converter(values[indices])
+
+    return values, target
+
+
+def _to_number(string: str) -> int | float:
+    try:
+        return int(string)
+    except ValueError:
+        return float(string)
+
+
+def _to_quantity(magnitude: Any, units: Unit) -> int | float | Quantity:
+    if not units._units and isinstance(magnitude, int | float):
+        return magnitude
+
+    return Quantity.from_magnitude(magnitude, units)
+
+
+def _parse_unit_expression(expression: str) -> tuple[Any, Unit] | None:
+    """
+    Parse a unit expression to a magnitude and units, or ``None`` if it is not valid.
+
+    Results, including invalid expressions, are cached by the registry, which clears its cache
+    when units are defined.
+    """
+    quantity = DEFAULT_UNIT_REGISTRY._parse_expression_or_none(expression)
+
+    if quantity is None:
+        return None
+
+    return quantity._magnitude, quantity.units
+
+
+def _parse_quantity(string: str) -> str | int | float | Quantity:
+    """Parse any other expression, like ``"2 / nanometer"``, in full."""
+    # ``Quantity(string)`` rejects blank strings, which Pint would parse as one
+    if not string.strip():
+        return string
+
+    quantity = DEFAULT_UNIT_REGISTRY._parse_expression_or_none(string)
+
+    if quantity is None:
+        return string
+
+    if not quantity._units and isinstance(quantity.magnitude, int | float):
+        return quantity.magnitude
+
+    return quantity
@@ -0,0 +1,160 @@
+"""
+Convert quantities to and from JSON-compatible dictionaries
+"""
+
+import base64
+from typing import Any, Literal
+
+import numpy
+
+from openff.units.units import Quantity, _format_units, _parse_units
+
+__all__ = [
+    "decode_tree",
+    "encode_tree",
+    "from_dict",
+    "to_dict",
+]
+
+ArrayEncoding = Literal["list", "base64"]
+
+
+def to_dict(quantity: Quantity, array_encoding: ArrayEncoding = "list") -> dict[str, Any]:
+    """
+    Convert a quantity to a JSON-compatible dictionary of its value and units.
+
+    The units are stored as a canonical string of their full names, so equal units are always
+    written the same way, and :func:`from_dict` only has to parse each distinct string once.
+
+    Parameters
+    ----------
+    quantity
+        The quantity to convert.
+    array_encoding
+        How to store array values. ``"list"`` stores nested lists of numbers, which loses the
+        dtype, and the shape of empty arrays. ``"base64"`` stores the dtype, the shape, and the raw
+        data encoded as base64, which is more compact for large arrays and round-trips exactly.
+
+    Examples
+    --------
+
+    >>> import numpy
+    >>> from openff.units import Quantity
+    >>> from openff.units.serialization import from_dict, to_dict
+    >>> to_dict(Quantity(1.5, "kcal/mol"))
+    {'value': 1.5, 'unit': 'kilocalorie / mole'}
+    >>> to_dict(Quantity(numpy.array([1.0, 2.0]), "angstrom"))
+    {'value': [1.0, 2.0], 'unit': 'angstrom'}
+    >>> from_dict({"value": 1.5, "unit": "kilocalorie / mole"})
+    <Quantity(1.5, 'kilocalorie / mole')>
+    """
+    magnitude = quantity._magnitude
+
+    if isinstance(magnitude, numpy.ndarray) and magnitude.ndim > 0:
+        if array_encoding == "list":
+            value: Any = magnitude.tolist()
+        elif array_encoding == "base64":
+            value = _encode_array(magnitude)
+        else:
+            raise ValueError(
+                f"Unsupported array encoding {array_encoding!r}, expected 'list' or 'base64'.",
+            )
+    elif isinstance(magnitude, numpy.generic | numpy.ndarray):
+        value = magnitude.item()
+    else:
+        value = magnitude
+
+    return {"value": value, "unit": _format_units(quantity._units)}
+
+
+def from_dict(data: dict[str, Any]) -> Quantity:
+    """
+    Convert a dictionary created by :func:`to_dict` back to a quantity.
+
+    Units are parsed once per distinct string and then reused, so converting many quantities with
+    the same units is fast. Lists are converted to NumPy arrays.
+
+    Raises
+    ------
+    ValueError
+        If the units are not valid units of the default unit registry.
+    """
+    value = data["value"]
+
+    if isinstance(value, dict):
+        value = _decode_array(value)
+
+    return Quantity.from_magnitude(value, _parse_units(data["unit"]))
+
+
+def encode_tree(tree: Any, array_encoding: ArrayEncoding = "list") -> Any:
+    """
+    Convert every quantity in a tree of dictionaries, lists, and tuples with :func:`to_dict`.
+
+    Tuples are converted to lists, and other values are left as they are, so the result can be
+    passed to :func:`json.dumps` if the input only contains quantities and JSON-compatible values.
+
+    Examples
+    --------
+
+    >>> import json
+    >>> from openff.units import Quantity
+    >>> from openff.units.serialization import decode_tree, encode_tree
+    >>> parameters = {"bonds": [{"id": "b1", "length": Quantity(1.5, "angstrom")}]}
+    >>> text = json.dumps(encode_tree(parameters))
+    >>> text
+    '{"bonds": [{"id": "b1", "length": {"value": 1.5, "unit": "angstrom"}}]}'
+    >>> decode_tree(json.loads(text))
+    {'bonds': [{'id': 'b1', 'length': <Quantity(1.5, 'angstrom')>}]}
+    """
+    if isinstance(tree, Quantity):
+        return to_dict(tree, array_encoding=array_encoding)
+    if isinstance(tree, dict):
+        return {key: encode_tree(value, array_encoding) for key, value in tree.items()}
+    if isinstance(tree, list | tuple):
+        return [encode_tree(value, array_encoding) for value in tree]
+
+    return tree
+
+
+def decode_tree(tree: Any) -> Any:
+    """
+    Convert every dictionary created by :func:`to_dict` in a tree back to a quantity.
+
+    Dictionaries with exactly the keys ``"value"`` and ``"unit"``, where the unit is a string, are
+    converted with :func:`from_dict`. Other dictionaries and lists are searched recursively.
+    """
+    if isinstance(tree, dict):
+        if _is_quantity_dict(tree):
+            return from_dict(tree)
+        return {key: decode_tree(value) for key, value in tree.items()}
+    if isinstance(tree, list):
+        return [decode_tree(value) for value in tree]
+
+    return tree
+
+
+def _is_quantity_dict(data: dict) -> bool:
+    return len(data) == 2 and "value" in data and isinstance(data.get("unit"), str)
+
+
+def _encode_array(array: numpy.ndarray) -> dict[str, Any]:
+    if array.dtype.hasobject:
+        raise ValueError("Cannot encode arrays of Python objects as base64.")
+
+    return {
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "data": base64.b64encode(numpy.ascontiguousarray(array).data).decode("ascii"),
+    }
+
+
+def _decode_array(value: dict[str, Any]) -> numpy.ndarray:
+    dtype = numpy.dtype(value["dtype"])
+
+    if dtype.hasobject:
+        raise ValueError("Cannot decode arrays of Python objects.")
+
+    data = bytearray(base64.b64decode(value["data"]))
+
+    return numpy.frombuffer(data, dtype=dtype).reshape(value["shape"])
@@ -0,0 +1,168 @@
+"""
+Share the magnitudes of large quantities between processes without copying them
+"""
+
+import sys
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy
+
+from openff.units.units import Quantity, _format_units, _parse_units
+
+__all__ = [
+    "SharedQuantity",
+    "share",
+]
+
+
+class SharedQuantity:
+    """
+    A handle to a quantity whose magnitude is stored in a shared memory segment.
+
+    Handles are created with :func:`share`, which copies the magnitude into a new segment once.
+    Pickling a handle only sends the name of the segment, the shape and dtype of the array, and
+    the units, so handles are cheap to pass to other processes, like the workers of a
+    :class:`concurrent.futures.ProcessPoolExecutor`. Each process then calls :meth:`attach` to get
+    a read-only quantity which reads directly from the segment.
+
+    The handle returned by :func:`share` owns the segment, which stays allocated until its owner
+    calls :meth:`unlink`, even if every process has closed it. Use the handle as a context manager
+    to close and unlink it automatically. In every process, the segment is unmapped once the
+    quantities returned by :meth:`attach` are garbage collected.
+
+    Before Python 3.13, attaching to a segment registers it with the resource tracker of the
+    attaching process, which unlinks the segment when that process exits. Processes started by
+    :mod:`multiprocessing` share the tracker of their parent, so this is only a problem for
+    processes which were started in other ways; attach from those with Python 3.13 or later.
+    """
+
+    def __init__(self, name: str, shape: tuple[int, ...], dtype: str, units: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self.units = units
+        self._segment: SharedMemory | None = None
+
+    @property
+    def owner(self) -> bool:
+        """Whether this handle created the segment, and so is responsible for unlinking it."""
+        return self._segment is not None
+
+    def __reduce__(self):
+        return type(self), (self.name, self.shape, self.dtype, self.units)
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedQuantity(name={self.name!r}, shape={self.shape}, dtype={self.dtype!r}, "
+            f"units={self.units!r})"
+        )
+
+    def __enter__(self) -> "SharedQuantity":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+        if self.owner:
+            self.unlink()
+
+    def attach(self) -> Quantity:
+        """
+        Get a read-only quantity backed by the shared memory segment.
+
+        The magnitude of the quantity is a view of the segment, so no data are copied. The segment
+        stays mapped into this process until the quantity, and any views of its magnitude, are
+        garbage collected, even after the handle is closed or unlinked.
+        """
+        array = numpy.asarray(_SegmentView(self.name, self.shape, self.dtype))
+
+        return Quantity.from_magnitude(array, _parse_units(self.units))
+
+    def close(self):
+        """Close the owner's access to the segment. Quantities which are attached stay valid."""
+        if self.owner:
+            self._segment.close()
+
+    def unlink(self):
+        """
+        Free the shared memory segment once every process has closed it.
+
+        Only the handle returned by :func:`share` may unlink the segment.
+        """
+        if not self.owner:
+            raise ValueError(
+                f"Only the handle returned by `share` can unlink shared quantity {self.name!r}.",
+            )
+
+        self._segment.unlink()
+
+
+class _SegmentView:
+    """
+    Exposes a shared memory segment to NumPy as a read-only array, and keeps it open.
+
+    Arrays created from a view hold it as their base, so the segment stays mapped until the last
+    array using it is garbage collected, and is then closed along with the view.
+    """
+
+    def __init__(self, name: str, shape: tuple[int, ...], dtype: str):
+        if sys.version_info >= (3, 13):
+            self.segment = SharedMemory(name=name, track=False)
+        else:
+            self.segment = SharedMemory(name=name)
+
+        # only the address is kept, so that no buffer is exported which would stop the segment
+        # from closing once the view is garbage collected
+        address = numpy.ndarray(1, dtype=numpy.uint8, buffer=self.segment.buf).ctypes.data
+
+        self.__array_interface__ = {
+            "shape": shape,
+            "typestr": dtype,
+            "data": (address, True),
+            "version": 3,
+        }
+
+
+def share(quantity: Quantity) -> SharedQuantity:
+    """
+    Copy the magnitude of a quantity into shared memory, and return a handle to it.
+
+    The returned handle owns the shared memory segment. Pass it, or copies of it, to other
+    processes, which call :meth:`SharedQuantity.attach` to read the quantity without copying it.
+    Call :meth:`SharedQuantity.unlink` to free the segment when the quantity is no longer needed,
+    or use the handle as a context manager.
+
+    Parameters
+    ----------
+    quantity
+        The quantity to share. Its magnitude must be a number or a NumPy array of numbers.
+
+    Examples
+    --------
+
+    >>> import numpy
+    >>> from openff.units import Quantity
+    >>> from openff.units.shared_memory import share
+    >>> positions = Quantity(numpy.zeros((1000, 3)), "nanometer")
+    >>> with share(positions) as handle:
+    ...     shared = handle.attach()
+    ...     print(shared.shape, shared.units)
+    (1000, 3) nanometer
+    """
+    array = numpy.asarray(quantity.m)
+
+    if array.dtype.hasobject:
+        raise ValueError("Cannot share quantities whose magnitudes are arrays of Python objects.")
+
+    segment = SharedMemory(create=True, size=max(array.nbytes, 1))
+
+    shared = numpy.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+    shared[...] = array
+    del shared
+
+    handle = SharedQuantity(
+        segment.name, array.shape, array.dtype.str, _format_units(quantity._units)
+    )
+    handle._segment = segment
+
+    return handle
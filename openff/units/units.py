@@ -2,20 +2,27 @@
 Core classes for OpenFF Units
 """
 
-import uuid
+import functools
+import sys
+import threading
 import warnings
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
+import numpy
 import pint
 from openff.utilities import requires_package
 from pint import Measurement as _Measurement
 from pint import Quantity as _Quantity
 from pint import Unit as _Unit
 
-from openff.units.utilities import get_defaults_path
+from openff.units._cache import CacheInfo, LRUCache
+from openff.units.exceptions import FrozenRegistryError
+from openff.units.utilities import get_cache_folder, get_defaults_path
 
 if TYPE_CHECKING:
     import openmm.unit
+    from pint.util import UnitsContainer
 
 __all__ = (
     "DEFAULT_UNIT_REGISTRY",
@@ -35,8 +42,173 @@ class Unit(pint.UnitRegistry.Unit):
 class Quantity(pint.UnitRegistry.Quantity):
     """A value with associated units."""
 
+    @classmethod
+    def from_magnitude(cls, magnitude, units: "Unit | str") -> "Quantity":
+        """
+        Construct a quantity from a magnitude and units, skipping most validation.
+
+        This is equivalent to ``Quantity(magnitude, units)`` but faster, which matters when
+        constructing many quantities in a loop. Resolve units once, ahead of the loop, and pass the
+        resulting ``Unit``; strings are accepted but parsed on each call.
+
+        Unlike the default constructor, ``magnitude`` is not checked, so it must be a number,
+        NumPy array, or another type that can be wrapped by a quantity. Lists and tuples are still
+        converted to NumPy arrays.
+
+        Examples
+        --------
+
+        >>> from openff.units import Quantity, Unit
+        >>> kcal_mol = Unit("kilocalorie / mole")
+        >>> Quantity.from_magnitude(1.5, kcal_mol)
+        <Quantity(1.5, 'kilocalorie / mole')>
+
+        """
+        if isinstance(units, str):
+            units = cls._REGISTRY.parse_units(units)
+        elif units._REGISTRY is not cls._REGISTRY:
+            raise ValueError("Cannot construct a quantity with units from a different registry.")
+
+        if isinstance(magnitude, list | tuple):
+            magnitude = numpy.asarray(magnitude)
+
+        quantity = object.__new__(cls)
+        quantity._magnitude = magnitude
+        quantity._units = units._units
+
+        return quantity
+
+    @classmethod
+    def from_strings(
+        cls,
+        strings: Iterable[str],
+        units: "Unit | str | None" = None,
+    ) -> "Quantity":
+        """
+        Parse a sequence of quantity strings into one quantity wrapping a NumPy array.
+
+        Each distinct unit expression is parsed once, and strings with units that differ from the
+        target units are converted to them with one array operation per unit. The result is a
+        contiguous array of 64-bit floats.
+
+        Parameters
+        ----------
+        strings
+            The strings to parse, like ``["1.5 * angstrom", "0.17 * nanometer"]``. Strings
+            without units, like ``"4"``, are dimensionless.
+        units
+            The units of the result. By default, the units of the first string are used.
+
+        Raises
+        ------
+        TypeError
+            If ``strings`` is a single string, rather than a sequence of them.
+        ValueError
+            If a string is not a quantity, or ``strings`` is empty and no ``units`` are given.
+        pint.errors.DimensionalityError
+            If the units of a string are not compatible with the units of the result.
+
+        Examples
+        --------
+
+        >>> from openff.units import Quantity
+        >>> Quantity.from_strings(["1.5 * angstrom", "1.7 * angstrom", "0.2 * nanometer"])
+        <Quantity([1.5 1.7 2. ], 'angstrom')>
+        >>> Quantity.from_strings(["25 * degC", "300 * kelvin"], units="kelvin")
+        <Quantity([298.15 300.  ], 'kelvin')>
+        """
+        from openff.units.parsing import _parse_strings
+
+        # a single string is iterable, and would be parsed one character at a time
+        if isinstance(strings, str | bytes):
+            raise TypeError(
+                f"Expected a sequence of quantity strings, got a single {type(strings).__name__}. "
+                "Use `Quantity(string)` to parse one string."
+            )
+
+        values, target = _parse_strings(strings, units)
+
+        return cls.from_magnitude(values, target)
+
+    def to(self, other=None, *contexts, **ctx_kwargs) -> "Quantity":
+        if _is_dask_array(self._magnitude) and not contexts and not ctx_kwargs:
+            return self._dask_to(other)
+
+        return super().to(other, *contexts, **ctx_kwargs)
+
+    def ito(self, other=None, *contexts, **ctx_kwargs) -> None:
+        if _is_dask_array(self._magnitude) and not contexts and not ctx_kwargs:
+            converted = self._dask_to(other)
+            self._magnitude = converted._magnitude
+            self._units = converted._units
+            self._dask_origin = converted._dask_origin
+            return None
+
+        return super().ito(other, *contexts, **ctx_kwargs)
+
+    def m_as(self, units):
+        if _is_dask_array(self._magnitude):
+            return self._dask_to(units)._magnitude
+
+        return super().m_as(units)
+
+    def _dask_to(self, other) -> "Quantity":
+        """
+        Lazily convert a quantity wrapping a Dask array, as a single ``map_blocks`` call.
+
+        The result remembers the array and units it was converted from, so that converting it
+        again starts from the original array rather than adding another step to the graph.
+        Converting back to the original units returns the original array.
+        """
+        from pint.util import to_units_container
+
+        from openff.units.converters import make_converter
+
+        source, source_units = self._magnitude, self._units
+
+        origin = getattr(self, "_dask_origin", None)
+        if origin is not None and origin[0] is self._magnitude:
+            _, source, source_units = origin
+
+        units = self._REGISTRY.Unit(to_units_container(other, self._REGISTRY))
+        converter = make_converter(self._REGISTRY.Unit(source_units), units)
+
+        if converter.scale == 1.0 and converter.offset == 0.0:
+            converted = source
+        else:
+            # declare the dtype the converter actually returns, i.e. float32 stays float32
+            converted = source.map_blocks(
+                converter,
+                dtype=converter(numpy.ones(1, dtype=source.dtype)).dtype,
+            )
+
+        quantity = self.from_magnitude(converted, units)
+        quantity._dask_origin = (converted, source, source_units)
+
+        return quantity
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle the quantity as its magnitude and a canonical string of its units.
+
+        NumPy arrays reduce themselves, which under protocol 5 passes their data as a
+        ``pickle.PickleBuffer``. Pickling with ``buffer_callback`` then keeps the data out of the
+        pickle itself, and loading with the same buffers reuses their memory rather than copying
+        it. Quantities are always unpickled into the default unit registry.
+        """
+        return _unpickle_quantity, (self._magnitude, _format_units(self._units))
+
     def __dask_tokenize__(self):
-        return uuid.uuid4().hex
+        """
+        Identify the quantity to Dask by its contents, so that equal quantities share a token.
+
+        The token combines the token of the magnitude, which is a Dask array's name or a hash of
+        the data of other arrays, and the units. Units are compared by name, so equal quantities in
+        different units, like ``1 nanometer`` and ``10 angstrom``, have different tokens.
+        """
+        from dask.base import tokenize
+
+        return ("openff.units.Quantity", tokenize(self._magnitude), _tokenize_units(self._units))
 
     @staticmethod
     def _dask_finalize(results, func, args, units):
@@ -44,6 +216,52 @@ class Quantity(pint.UnitRegistry.Quantity):
         return Quantity(values, units)
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_units(units: "UnitsContainer") -> str:
+    """
+    Format units as a canonical string of their full names, in the default unit registry.
+
+    Equal units are always written the same way, so readers only parse each distinct string once.
+    The format is explicit, so it does not follow the registry's ``formatter.default_format``.
+    Results are cached, so each ``UnitsContainer`` is only formatted once.
+    """
+    return format(DEFAULT_UNIT_REGISTRY.Unit(units), "D")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_units(units: str) -> "Unit":
+    """
+    Parse units written by :func:`_format_units`, raising ``ValueError`` if they are invalid.
+
+    Units are parsed with ``as_delta=False`` so that offset units, like ``degree_Celsius``, are
+    read back as they were written. Results are cached, so each string is only parsed once.
+    """
+    try:
+        return DEFAULT_UNIT_REGISTRY.parse_units(units, as_delta=False)
+    except Exception as error:
+        raise ValueError(f"Invalid units {units!r}.") from error
+
+
+def _unpickle_quantity(magnitude, units: str) -> "Quantity":
+    return Quantity.from_magnitude(magnitude, _parse_units(units))
+
+
+def _unpickle_measurement(magnitude, units: str) -> "Measurement":
+    return Measurement(magnitude, units=_parse_units(units))
+
+
+def _is_dask_array(value) -> bool:
+    """Check for a Dask array without importing Dask, which is only loaded if arrays exist."""
+    dask_array = sys.modules.get("dask.array")
+
+    return dask_array is not None and isinstance(value, dask_array.Array)
+
+
+def _tokenize_units(units) -> tuple[tuple[str, float], ...]:
+    """Describe a ``UnitsContainer`` independently of the order its units were combined in."""
+    return tuple(sorted(units.items()))
+
+
 @requires_package("openmm")
 def _to_openmm(self) -> "openmm.unit.Quantity":
     """Convert the quantity to an ``openmm.unit.Quantity``.
@@ -61,8 +279,24 @@ def _to_openmm(self) -> "openmm.unit.Quantity":
 class Measurement(pint.UnitRegistry.Measurement):
     """A value with associated units and uncertainty."""
 
+    def __reduce_ex__(self, protocol):
+        """Pickle the measurement as its magnitude and a canonical string of its units."""
+        return _unpickle_measurement, (self._magnitude, _format_units(self._units))
+
     def __dask_tokenize__(self):
-        return uuid.uuid4().hex
+        """
+        Identify the measurement to Dask by its value, uncertainty, and units.
+
+        Correlations between measurements are not part of the token, so measurements with equal
+        values and uncertainties share a token even if they derive from different variables.
+        """
+        from dask.base import tokenize
+
+        return (
+            "openff.units.Measurement",
+            tokenize(self.value.magnitude, self.error.magnitude),
+            _tokenize_units(self._units),
+        )
 
     @staticmethod
     def _dask_finalize(results, func, args, units):
@@ -70,13 +304,193 @@ class Measurement(pint.UnitRegistry.Measurement):
         return Measurement(values, units)
 
 
+# Stored in the parse cache for expressions which failed to parse
+_INVALID_EXPRESSION = object()
+
+
 class UnitRegistry(pint.UnitRegistry):
-    _quantity_class = Quantity
-    _unit_class = Unit
-    _measurement_class = Measurement
+    """
+    A registry of units.
+
+    Results of parsing strings with ``parse_units`` and ``parse_expression``, which back
+    constructors like ``Unit(str)`` and ``Quantity(str)``, are kept in a least-recently-used cache
+    keyed on the raw string. Its size can be set with the ``parse_cache_size`` argument or
+    :meth:`set_parse_cache_size`, where a size of 0 disables it. The cache is cleared when units
+    are defined; call :meth:`clear_parse_cache` after changing other settings that affect parsing.
+
+    Parsing and converting are safe from multiple threads, including on free-threaded builds of
+    Python, as long as no thread changes the registry at the same time. Defining units and enabling
+    or disabling contexts change it for every thread. These changes are serialized with a lock,
+    but a thread which is parsing or converting may still see a change half-way through. Call
+    :meth:`freeze` once the registry is set up to make further changes raise an error instead.
+    """
+
+    # Pint subclasses these for each registry instance in ``_init_dynamic_classes``
+    Quantity = Quantity
+    Unit = Unit
+    Measurement = Measurement
+
+    def __init__(self, *args, parse_cache_size: int = 1024, **kwargs):
+        self._parse_cache = LRUCache(parse_cache_size)
+        self._lock = threading.RLock()
+        self._frozen = False
+
+        super().__init__(*args, **kwargs)
+
+    def parse_units(
+        self,
+        input_string: str,
+        as_delta: bool | None = None,
+        case_sensitive: bool | None = None,
+    ) -> Unit:
+        if not isinstance(input_string, str):
+            return super().parse_units(input_string, as_delta, case_sensitive)
+
+        key = ("units", input_string, as_delta, case_sensitive)
+
+        units = self._parse_cache.get(key)
+
+        if units is None:
+            units = super().parse_units(input_string, as_delta, case_sensitive)
+            self._parse_cache.put(key, units)
+
+        return units
+
+    def parse_expression(
+        self,
+        input_string: str,
+        case_sensitive: bool | None = None,
+        **values,
+    ) -> Quantity:
+        if values or not isinstance(input_string, str):
+            return super().parse_expression(input_string, case_sensitive, **values)
+
+        key = ("expression", input_string, case_sensitive)
+
+        cached = self._parse_cache.get(key)
+
+        # invalid expressions are parsed again, to raise the error
+        if cached is None or cached is _INVALID_EXPRESSION:
+            quantity = super().parse_expression(input_string, case_sensitive)
+            self._parse_cache.put(key, (quantity.magnitude, quantity.units))
+
+            return quantity
+
+        # quantities are mutable, so always return a new one
+        magnitude, units = cached
+
+        return self.Quantity.from_magnitude(magnitude, units)
+
+    def _parse_expression_or_none(self, input_string: str) -> Quantity | None:
+        """
+        Parse an expression like :meth:`parse_expression`, or return ``None`` if it is invalid.
+
+        Invalid expressions are cached too, so that strings which are not quantities, like
+        names, are only parsed once rather than raising an exception every time.
+        """
+        key = ("expression", input_string, None)
+
+        cached = self._parse_cache.get(key)
+
+        if cached is _INVALID_EXPRESSION:
+            return None
+
+        if cached is None:
+            try:
+                quantity = super().parse_expression(input_string)
+            except Exception:
+                self._parse_cache.put(key, _INVALID_EXPRESSION)
+                return None
+
+            self._parse_cache.put(key, (quantity.magnitude, quantity.units))
+
+            return quantity
+
+        magnitude, units = cached
+
+        return self.Quantity.from_magnitude(magnitude, units)
+
+    def define(self, definition):
+        with self._lock:
+            self._check_not_frozen("define units")
+            super().define(definition)
+            self.clear_parse_cache()
+
+    def load_definitions(self, *args, **kwargs):
+        with self._lock:
+            self._check_not_frozen("load definitions")
+            loaded_files = super().load_definitions(*args, **kwargs)
+            self.clear_parse_cache()
+
+        return loaded_files
+
+    def enable_contexts(self, *names_or_contexts, **kwargs):
+        with self._lock:
+            self._check_not_frozen("enable contexts")
+            super().enable_contexts(*names_or_contexts, **kwargs)
+
+    def disable_contexts(self, n: int | None = None):
+        with self._lock:
+            self._check_not_frozen("disable contexts")
+            super().disable_contexts(n)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry has been frozen with :meth:`freeze`."""
+        return self._frozen
+
+    def freeze(self):
+        """
+        Prevent further changes to the registry, so that it can be shared between threads safely.
+
+        After freezing, defining units, loading definitions, and enabling or disabling contexts
+        raise :class:`~openff.units.exceptions.FrozenRegistryError`. This includes converting with
+        contexts, like ``quantity.to("nanometer", "some_context")``. Freezing cannot be undone.
+        """
+        with self._lock:
+            self._frozen = True
+
+    def _check_not_frozen(self, action: str):
+        if self._frozen:
+            raise FrozenRegistryError(f"Cannot {action} in a frozen unit registry.")
+
+    def parse_cache_info(self) -> CacheInfo:
+        """Report hits, misses, evictions, maximum size, and current size of the parse cache."""
+        return self._parse_cache.info()
+
+    def clear_parse_cache(self):
+        """Remove all entries from the parse cache and reset its statistics."""
+        self._parse_cache.clear()
+
+    def set_parse_cache_size(self, maxsize: int):
+        """Set the maximum number of entries in the parse cache. A size of 0 disables it."""
+        self._parse_cache.maxsize = maxsize
+
+
+def _build_default_registry() -> UnitRegistry:
+    """
+    Build the default registry, loading it from an on-disk cache if one is configured.
+
+    Pint keys its cache on the contents of the definition files and on its own version, so
+    stale entries are never used. Any failure to read or write the cache (i.e. a corrupt file
+    or a read-only folder) falls back to parsing the definition files directly.
+    """
+    cache_folder = get_cache_folder()
+
+    if cache_folder is not None:
+        try:
+            return UnitRegistry(get_defaults_path(), cache_folder=cache_folder)
+        except Exception as error:
+            warnings.warn(
+                f"Failed to use unit registry cache in {cache_folder}, parsing definitions "
+                f"instead. Error: {error!r}",
+                stacklevel=2,
+            )
+
+    return UnitRegistry(get_defaults_path())
 
 
-DEFAULT_UNIT_REGISTRY = UnitRegistry(get_defaults_path())
+DEFAULT_UNIT_REGISTRY = _build_default_registry()
 
 unit = DEFAULT_UNIT_REGISTRY
 
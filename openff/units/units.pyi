@@ -1,12 +1,28 @@
+from collections.abc import Iterable
+from typing import Any
+
 import numpy
+from pint.util import UnitsContainer
 
 class Unit:
+    _REGISTRY: UnitRegistry
+    _units: UnitsContainer
+
     def __init__(self, *args, **kwargs): ...
     def __mul__(self, other: int | float | numpy.ndarray) -> Quantity: ...
     __rmul__ = __mul__
+    def __truediv__(self, other: Unit) -> Unit: ...
 
 class Quantity:
+    # read directly where constructing a ``Unit`` from it would be too slow
+    _units: UnitsContainer
+    _magnitude: Any
+
     def __init__(self, *args, **kwargs): ...
+    @classmethod
+    def from_magnitude(cls, magnitude, units: str | Unit) -> Quantity: ...
+    @classmethod
+    def from_strings(cls, strings: Iterable[str], units: str | Unit | None = None) -> Quantity: ...
     def to(self, unit: str | Unit = "dimensionless") -> Quantity: ...
     def to_base_units(self, unit: str | Unit = "dimensionless") -> Quantity: ...
     def is_compatible_with(self, unit: str | Unit) -> bool: ...
@@ -20,3 +36,17 @@ class Quantity:
 
     magnitude = m
     units = u
+
+class UnitRegistry:
+    def convert(self, value: float, src: Unit, dst: Unit) -> float: ...
+    def get_root_units(self, input_units: Unit) -> tuple[float, Unit]: ...
+    def parse_units(self, input_string: str, as_delta: bool | None = None) -> Unit: ...
+    def parse_expression(self, input_string: str) -> Quantity: ...
+    def _parse_expression_or_none(self, input_string: str) -> Quantity | None: ...
+    # units and constants, like ``DEFAULT_UNIT_REGISTRY.angstrom``
+    def __getattr__(self, name: str) -> Any: ...
+
+DEFAULT_UNIT_REGISTRY: UnitRegistry
+
+def _format_units(units: UnitsContainer) -> str: ...
+def _parse_units(units: str) -> Unit: ...
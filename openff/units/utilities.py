@@ -2,13 +2,30 @@
 Utility methods for OpenFF Units
 """
 
+import os
+
 from openff.utilities import get_data_file_path
 
 __all__ = [
+    "get_cache_folder",
     "get_defaults_path",
 ]
 
+CACHE_FOLDER_ENVIRONMENT_VARIABLE = "OPENFF_UNITS_CACHE_FOLDER"
+
 
 def get_defaults_path() -> str:
     """Get the full path to the ``defaults.txt`` file"""
     return get_data_file_path("defaults.txt", "openff.units")
+
+
+def get_cache_folder() -> str | None:
+    """
+    Get the folder used to cache the parsed default unit registry, if any.
+
+    The cache is opt-in and is controlled by the ``OPENFF_UNITS_CACHE_FOLDER`` environment
+    variable. It may be set to a path or to ``":auto:"``, which uses Pint's per-user cache
+    directory. If unset or empty, ``None`` is returned and the registry is always parsed from
+    the definition files.
+    """
+    return os.environ.get(CACHE_FOLDER_ENVIRONMENT_VARIABLE) or None
@@ -0,0 +1,8 @@
+from typing import NamedTuple
+
+from openmm import unit as unit
+
+class Vec3(NamedTuple):
+    x: float
+    y: float
+    z: float
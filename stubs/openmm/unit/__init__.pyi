@@ -1,9 +1,13 @@
 from collections.abc import Generator
+from typing import Any
 
 import numpy
 from openmm.unit.baseunit import BaseUnit
 
 class Quantity:
+    # private, but the only way to read the value without ``value_in_unit`` deep-copying it
+    _value: Any
+
     def __init__(self, *args, **kwargs) -> None: ...
     @property
     def unit(self) -> Unit: ...
@@ -20,3 +24,4 @@ class Unit:
 dalton = Unit("dalton")
 dimensionless = Unit("dimensionless")
 atmosphere = Unit("atmosphere")
+nanometer = Unit("nanometer")